@@ -0,0 +1,46 @@
+# benchmark.py - benchmark the search on the fixed position corpus
+import sys
+import json
+import argparse
+
+from engine.benchmark import CORPUS_VERSION, run_benchmarks, check_node_searches, compare
+
+def main():
+    """Run the benchmarks, compare two result files, or check the node searches agree"""
+    parser = argparse.ArgumentParser(description="Chain Reaction search benchmarks")
+    parser.add_argument("--levels", type=int, nargs="*", help="levels to benchmark (default: all minimax levels)")
+    parser.add_argument("--repeat", type=int, default=3, help="timing runs per measurement, the fastest counts")
+    parser.add_argument("--max-depth", type=int, default=3, help="deepest depth for time-to-depth")
+    parser.add_argument("--corpus", type=int, default=CORPUS_VERSION, help="corpus version")
+    parser.add_argument("--output", help="write the results to this JSON file (default: stdout)")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="compare two result files")
+    parser.add_argument("--check-searches", action="store_true",
+                        help="check every node search finds the same best scores on the corpus")
+    parser.add_argument("--depth", type=int, help="search depth for --check-searches (default: each level's)")
+    args = parser.parse_args()
+    
+    if args.compare:
+        with open(args.compare[0], 'r') as f:
+            old = json.load(f)
+        with open(args.compare[1], 'r') as f:
+            new = json.load(f)
+        print('\n'.join(compare(old, new)))
+        return
+    
+    log = lambda message: print(message, file=sys.stderr)
+    if args.check_searches:
+        mismatches = check_node_searches(args.levels, args.depth, args.corpus, log)
+        print('\n'.join(mismatches) if mismatches else "All node searches agree")
+        sys.exit(1 if mismatches else 0)
+    
+    results = run_benchmarks(args.levels, args.repeat, args.max_depth, args.corpus, log)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=1)
+        log(f"Results written to {args.output}")
+    else:
+        json.dump(results, sys.stdout, indent=1)
+        print()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+# engine - shared Chain Reaction game engine for the AI players
+# Submodules are imported where they are used, so a player or pool worker
+# only loads what it needs (engine.vectorized and NumPy only for benchmarks)
@@ -0,0 +1,238 @@
+# engine/benchmark.py - search benchmarks over a fixed, versioned position corpus
+import os
+import sys
+import json
+import time
+import platform
+
+from engine.board import parse_board, get_valid_moves, make_move, unmake_move
+from engine.levels import LEVEL_CONFIG
+from engine.evaluate import evaluate_board
+from engine.transposition import TranspositionTable
+from engine.search import NODE_SEARCHES, MoveHistory, search_root
+from engine.stats import SearchStats
+from engine.vectorized import HAVE_NUMPY, np, evaluate_batch, explode_batch
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks")
+CORPUS_VERSION = 1
+
+def minimax_levels():
+    """The levels that search with minimax, which the benchmarks cover by default"""
+    return [level for level in sorted(LEVEL_CONFIG) if LEVEL_CONFIG[level].get("algorithm", "minimax") == "minimax"]
+
+def load_corpus(version=CORPUS_VERSION):
+    """The benchmark positions, as a list of dicts with a parsed "board" added"""
+    with open(os.path.join(CORPUS_DIR, f"positions_v{version}.json"), 'r') as f:
+        corpus = json.load(f)
+    for position in corpus["positions"]:
+        position["board"] = parse_board(position["rows"])
+    return corpus
+
+def best_time(function, repeat):
+    """Fastest of repeat runs of function(), and its last return value"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def _search(board, depth, level, color, stats=None):
+    # A fresh table per run, with the players' gating, so every run does the same work
+    tt = TranspositionTable() if depth >= 3 else None
+    return search_root(board, depth, level, color, tt, None, stats)
+
+def bench_search(position, level, depth, repeat):
+    """minimax_no_timeout at a fixed depth: time, nodes, nodes/sec"""
+    board, color = position["board"], position["to_move"]
+    seconds, (score, move) = best_time(lambda: _search(board, depth, level, color), repeat)
+    # Counted in a separate run, the timers slow the search down
+    stats = SearchStats()
+    _search(board, depth, level, color, stats)
+    return {
+        "depth": depth,
+        "seconds": seconds,
+        "nodes": stats.nodes,
+        "nodes_per_sec": stats.nodes / seconds if seconds else 0.0,
+        "evaluations": stats.evaluations,
+        "waves": stats.waves,
+        "cutoffs": stats.cutoffs,
+        "tt_hits": stats.tt_hits,
+        "phase_times": stats.times,
+        "score": score,
+        "move": move,
+    }
+
+def bench_time_to_depth(position, level, max_depth, repeat):
+    """Seconds to complete each depth 1..max_depth, one shared table as in iterative deepening"""
+    board, color = position["board"], position["to_move"]
+
+    def deepen():
+        tt = TranspositionTable()
+        times, scores = [], []
+        start = time.perf_counter()
+        for depth in range(1, max_depth + 1):
+            # The aspiration windows of iterative_deepening
+            guess = scores[-2] if len(scores) >= 2 else None
+            scores.append(search_root(board, depth, level, color, tt, None, None, guess)[0])
+            times.append(time.perf_counter() - start)
+        return times
+
+    runs = [deepen() for _ in range(repeat)]
+    return [min(run[i] for run in runs) for i in range(max_depth)]
+
+def bench_explode(position, repeat):
+    """Every valid move made and unmade: explode() waves per second"""
+    board, color = position["board"], position["to_move"]
+    moves = get_valid_moves(board, color)
+
+    def run():
+        waves = 0
+        for r, c in moves:
+            waves += make_move(board, r, c, color)
+            unmake_move(board)
+        return waves
+
+    seconds, waves = best_time(run, repeat)
+    result = {"moves": len(moves), "waves": waves, "waves_per_sec": waves / seconds if seconds else 0.0}
+    if HAVE_NUMPY:
+        # The same moves through explode_batch, all at once
+        seconds, _ = best_time(lambda: explode_batch(board.counts, board.owners, moves, color), repeat)
+        result["batch_waves_per_sec"] = waves / seconds if seconds else 0.0
+    return result
+
+def bench_evaluate(position, level, repeat, calls=1000):
+    """evaluate_board calls per second"""
+    board, color = position["board"], position["to_move"]
+
+    def run():
+        for _ in range(calls):
+            evaluate_board(board, level, color)
+
+    seconds, _ = best_time(run, repeat)
+    return calls / seconds if seconds else 0.0
+
+def bench_evaluate_batch(position, level, repeat, calls=100):
+    """evaluate_batch over all children of the position: evaluations per second"""
+    board, color = position["board"], position["to_move"]
+    counts, owners = [], []
+    for r, c in get_valid_moves(board, color):
+        make_move(board, r, c, color)
+        counts.append(bytes(board.counts))
+        owners.append(bytes(board.owners))
+        unmake_move(board)
+    children = len(counts)
+    counts, owners = b''.join(counts), b''.join(owners)
+
+    def run():
+        for _ in range(calls):
+            evaluate_batch(counts, owners, level, color)
+
+    seconds, _ = best_time(run, repeat)
+    return calls * children / seconds if seconds else 0.0
+
+def run_benchmarks(levels=None, repeat=3, max_depth=3, version=CORPUS_VERSION, log=None):
+    """Run every benchmark on every corpus position, returns the JSON-ready results"""
+    corpus = load_corpus(version)
+    levels = levels or minimax_levels()
+    positions = {}
+    for position in corpus["positions"]:
+        if log:
+            log(f"{position['name']}...")
+        result = {"phase": position["phase"], "explode": bench_explode(position, repeat), "levels": {}}
+        for level in levels:
+            result["levels"][str(level)] = {
+                "search": bench_search(position, level, LEVEL_CONFIG[level]["depth"], repeat),
+                "time_to_depth": bench_time_to_depth(position, level, max_depth, repeat),
+                "evaluations_per_sec": bench_evaluate(position, level, repeat),
+            }
+            if HAVE_NUMPY:
+                result["levels"][str(level)]["batch_evaluations_per_sec"] = bench_evaluate_batch(position, level,
+                                                                                                 repeat)
+        positions[position["name"]] = result
+
+    return {
+        "corpus_version": corpus["version"],
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__ if HAVE_NUMPY else None,
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "positions": positions,
+        "summary": summarize(positions),
+    }
+
+def summarize(positions):
+    """Totals per level over all positions, the numbers to compare between runs"""
+    summary = {"explode_waves_per_sec": None, "levels": {}}
+    waves = sum(p["explode"]["waves"] for p in positions.values())
+    seconds = sum(p["explode"]["waves"] / p["explode"]["waves_per_sec"]
+                  for p in positions.values() if p["explode"]["waves_per_sec"])
+    summary["explode_waves_per_sec"] = waves / seconds if seconds else 0.0
+    if all("batch_waves_per_sec" in p["explode"] for p in positions.values()):
+        seconds = sum(p["explode"]["waves"] / p["explode"]["batch_waves_per_sec"]
+                      for p in positions.values() if p["explode"]["batch_waves_per_sec"])
+        summary["explode_batch_waves_per_sec"] = waves / seconds if seconds else 0.0
+
+    for level in next(iter(positions.values()))["levels"]:
+        runs = [p["levels"][level] for p in positions.values()]
+        nodes = sum(run["search"]["nodes"] for run in runs)
+        seconds = sum(run["search"]["seconds"] for run in runs)
+        summary["levels"][level] = {
+            "search_seconds": seconds,
+            "nodes": nodes,
+            "nodes_per_sec": nodes / seconds if seconds else 0.0,
+            "time_to_depth": [sum(run["time_to_depth"][i] for run in runs)
+                              for i in range(len(runs[0]["time_to_depth"]))],
+            "evaluations_per_sec": sum(run["evaluations_per_sec"] for run in runs) / len(runs),
+        }
+        if all("batch_evaluations_per_sec" in run for run in runs):
+            summary["levels"][level]["batch_evaluations_per_sec"] = (
+                sum(run["batch_evaluations_per_sec"] for run in runs) / len(runs))
+    return summary
+
+def check_node_searches(levels=None, depth=None, version=CORPUS_VERSION, log=None):
+    """Search every corpus position with each of NODE_SEARCHES, returns lines for the scores that differ
+
+    Each level is searched at its own depth unless depth is given, with
+    the players' table gating. The searches must agree on the best score;
+    the move may differ between equally good ones.
+    """
+    corpus = load_corpus(version)
+    levels = levels or minimax_levels()
+    mismatches = []
+    for position in corpus["positions"]:
+        if log:
+            log(f"{position['name']}...")
+        board, color = position["board"], position["to_move"]
+        for level in levels:
+            search_depth = depth or LEVEL_CONFIG[level]["depth"]
+            results = {}
+            for name, search in NODE_SEARCHES.items():
+                tt = TranspositionTable() if search_depth >= 3 else None
+                results[name] = search(board, search_depth, float('-inf'), float('inf'), True, level, color, tt,
+                                       None, None, MoveHistory())
+            if len({score for score, _ in results.values()}) > 1:
+                found = ', '.join(f"{name} {score} at {move}" for name, (score, move) in results.items())
+                mismatches.append(f"{position['name']} level {level} depth {search_depth}: {found}")
+    return mismatches
+
+def compare(old, new):
+    """Lines comparing the summaries of two result files, ratios are new / old speed"""
+    lines = []
+    if old["corpus_version"] != new["corpus_version"]:
+        lines.append(f"Warning: corpus versions differ ({old['corpus_version']} vs {new['corpus_version']})")
+    a, b = old["summary"], new["summary"]
+    lines.append(f"explode waves/sec: {a['explode_waves_per_sec']:.0f} -> {b['explode_waves_per_sec']:.0f} "
+                 f"(x{b['explode_waves_per_sec'] / a['explode_waves_per_sec']:.2f})")
+    for level in b["levels"]:
+        if level not in a["levels"]:
+            continue
+        x, y = a["levels"][level], b["levels"][level]
+        lines.append(f"level {level}: search {x['search_seconds']:.3f}s -> {y['search_seconds']:.3f}s "
+                     f"(x{x['search_seconds'] / y['search_seconds']:.2f} faster), "
+                     f"nodes {x['nodes']} -> {y['nodes']}, "
+                     f"nodes/sec x{y['nodes_per_sec'] / x['nodes_per_sec']:.2f}, "
+                     f"evaluations/sec x{y['evaluations_per_sec'] / x['evaluations_per_sec']:.2f}")
+    return lines
@@ -0,0 +1,396 @@
+# engine/board.py - compact board representation used by the AI players
+import random
+
+ROWS, COLS = 9, 6
+CELLS = ROWS * COLS
+
+# Owner codes stored in Board.owners
+EMPTY, RED, BLUE = 0, 1, 2
+COLOR_CODE = {'R': RED, 'B': BLUE}
+COLOR_NAME = {RED: 'R', BLUE: 'B'}
+OPPONENT = {RED: BLUE, BLUE: RED}
+OPPONENT_COLOR = {'R': 'B', 'B': 'R'}
+
+# Pre-calculated per-cell tables, indexed by flat cell index r * COLS + c
+CELL_RANGE = range(CELLS)
+CELL_COORDS = []
+CRITICAL_MASS_AT = []
+NEIGHBORS_AT = []
+POSITION_WEIGHT_AT = []
+
+for r in range(ROWS):
+    for c in range(COLS):
+        CELL_COORDS.append((r, c))
+
+        if (r in [0, ROWS-1]) and (c in [0, COLS-1]):
+            CRITICAL_MASS_AT.append(2)  # Corner
+            POSITION_WEIGHT_AT.append(3)
+        elif r in [0, ROWS-1] or c in [0, COLS-1]:
+            CRITICAL_MASS_AT.append(3)  # Edge
+            POSITION_WEIGHT_AT.append(2)
+        else:
+            CRITICAL_MASS_AT.append(4)  # Interior
+            POSITION_WEIGHT_AT.append(1)
+
+        neighbors = []
+        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < ROWS and 0 <= nc < COLS:
+                neighbors.append(nr * COLS + nc)
+        NEIGHBORS_AT.append(tuple(neighbors))
+
+# count / critical mass in twelfths, critical mass being 2, 3 or 4
+CRITICAL_SHARE_AT = [12 // mass for mass in CRITICAL_MASS_AT]
+
+# The evaluation terms of a cell packed into one int, TERMS_AT[i][owner << 8 | count].
+# The low 64 bits hold four signed 16-bit fields, lowest first: count * critical
+# share, count * position weight, the position weight of an occupied cell, and 1
+# for an occupied cell. They are positive for Blue's cells and negative for Red's.
+# Above them sit two masks of CELLS bits, Red's then Blue's, where a cell's bit is
+# set when it is one orb from critical mass. Summing these ints over the board
+# keeps every field separate, so Board.terms is kept up to date like the hash.
+TERM_BITS = 16
+TERM_MASK = (1 << TERM_BITS) - 1
+TERM_HALF = 1 << (TERM_BITS - 1)
+LOADED_SHIFT = 4 * TERM_BITS
+CELLS_MASK = (1 << CELLS) - 1
+TERMS_AT = []
+for i in CELL_RANGE:
+    terms = [0] * 256
+    for sign in (-1, 1):
+        for count in range(256):
+            value = 0
+            if count:
+                value = sign * (count * CRITICAL_SHARE_AT[i] + (count * POSITION_WEIGHT_AT[i] << TERM_BITS)
+                                + (POSITION_WEIGHT_AT[i] << 2 * TERM_BITS) + (1 << 3 * TERM_BITS))
+                if count >= CRITICAL_MASS_AT[i] - 1:
+                    value += 1 << LOADED_SHIFT + (CELLS if sign > 0 else 0) + i
+            terms.append(value)
+    TERMS_AT.append(terms)
+
+# Zobrist keys: ZOBRIST_AT[i][owner << 8 | count], empty cells hash to 0
+_zobrist_rng = random.Random(318)
+ZOBRIST_AT = [[0] * 256 + [_zobrist_rng.getrandbits(64) for _ in range(512)]
+              for _ in CELL_RANGE]
+SIDE_KEY = _zobrist_rng.getrandbits(64)
+
+def unpack_terms(terms):
+    """Board.terms as (critical, strategic, placed, occupied, red loaded mask, blue loaded mask)"""
+    critical = ((terms + TERM_HALF) & TERM_MASK) - TERM_HALF
+    terms = (terms - critical) >> TERM_BITS
+    strategic = ((terms + TERM_HALF) & TERM_MASK) - TERM_HALF
+    terms = (terms - strategic) >> TERM_BITS
+    placed = ((terms + TERM_HALF) & TERM_MASK) - TERM_HALF
+    terms = (terms - placed) >> TERM_BITS
+    occupied = ((terms + TERM_HALF) & TERM_MASK) - TERM_HALF
+    loaded = (terms - occupied) >> TERM_BITS
+    return critical, strategic, placed, occupied, loaded & CELLS_MASK, loaded >> CELLS
+
+class Board:
+    """9x6 board kept as two flat bytearrays: orb counts and owner codes
+
+    frontier lists the cells that may be at or above critical mass, which
+    is where explode() starts looking instead of scanning the whole board.
+    orbs holds the running orb total per owner code ([empty, red, blue]),
+    hash the Zobrist hash of the cells and terms the sum of their TERMS_AT
+    evaluation terms, all updated incrementally. undo is the stack of
+    frames pushed by make_move for unmake_move.
+    """
+
+    __slots__ = ("counts", "owners", "frontier", "orbs", "hash", "terms", "undo")
+
+    def __init__(self, counts=None, owners=None, frontier=None, orbs=None, hash=0, terms=0):
+        self.counts = bytearray(CELLS) if counts is None else counts
+        self.owners = bytearray(CELLS) if owners is None else owners
+        self.frontier = [] if frontier is None else frontier
+        self.orbs = [0, 0, 0] if orbs is None else orbs
+        self.hash = hash
+        self.terms = terms
+        self.undo = []
+
+    def copy(self):
+        """Independent copy of the board"""
+        return Board(self.counts[:], self.owners[:], self.frontier[:], self.orbs[:], self.hash, self.terms)
+
+    def refresh(self):
+        """Recompute frontier, orb totals, hash and terms after direct edits to the cells"""
+        counts, owners = self.counts, self.owners
+        self.frontier = [i for i in CELL_RANGE if counts[i] >= CRITICAL_MASS_AT[i]]
+        self.orbs = [0, 0, 0]
+        self.hash = 0
+        self.terms = 0
+        for i in CELL_RANGE:
+            self.orbs[owners[i]] += counts[i]
+            self.hash ^= ZOBRIST_AT[i][owners[i] << 8 | counts[i]]
+            self.terms += TERMS_AT[i][owners[i] << 8 | counts[i]]
+
+    def cell(self, r, c):
+        """Cell as the (count, color) tuple of the text format, or None"""
+        i = r * COLS + c
+        count = self.counts[i]
+        return (count, COLOR_NAME[self.owners[i]]) if count else None
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Build a board from a list of lists of (count, color) tuples"""
+        board = cls()
+        for r, row in enumerate(rows):
+            for c, cell in enumerate(row):
+                if cell:
+                    i = r * COLS + c
+                    board.counts[i] = cell[0]
+                    board.owners[i] = COLOR_CODE[cell[1]]
+        board.refresh()
+        return board
+
+    def to_rows(self):
+        """Convert back to a list of lists of (count, color) tuples"""
+        return [[self.cell(r, c) for c in range(COLS)] for r in range(ROWS)]
+
+    def __eq__(self, other):
+        return (isinstance(other, Board) and self.counts == other.counts
+                and self.owners == other.owners)
+
+def parse_board(lines):
+    """Parse board from text lines"""
+    board = Board()
+    counts, owners = board.counts, board.owners
+    i = 0
+    for line in lines:
+        for p in line.strip().split():
+            if p != '0':
+                counts[i] = int(p[:-1])
+                owners[i] = COLOR_CODE[p[-1]]
+            i += 1
+    board.refresh()
+    return board
+
+def board_to_lines(board):
+    """Convert board to text lines"""
+    counts, owners = board.counts, board.owners
+    lines = []
+    for r in range(ROWS):
+        line = []
+        for i in range(r * COLS, (r + 1) * COLS):
+            line.append('0' if not counts[i] else f"{counts[i]}{COLOR_NAME[owners[i]]}")
+        lines.append(' '.join(line))
+    return lines
+
+def explode(board, max_iterations=1000, touched=None):
+    """Handle chain reactions with maximum iteration limit only
+
+    Each wave only re-checks the cells changed by the previous wave, in
+    row-major order, so the result is the same as rescanning the board.
+    Once a color that was on the board is wiped out the winner is decided
+    and the rest of the cascade is left in the frontier. If touched is a
+    list, every cell's prior state is appended to it (see make_move).
+    """
+    counts, owners, orbs = board.counts, board.owners, board.orbs
+    frontier = board.frontier
+
+    # Most moves just add an orb below critical mass: one empty wave
+    if len(frontier) == 1 and counts[frontier[0]] < CRITICAL_MASS_AT[frontier[0]]:
+        board.frontier = []
+        return 1
+
+    record = (touched if touched is not None else []).append
+    h = board.hash
+    t = board.terms
+    candidates = sorted(set(frontier))
+    contested = orbs[RED] and orbs[BLUE]
+    explosion_count = 0
+
+    while explosion_count < max_iterations:
+        explosion_count += 1
+
+        # Snapshot the unstable cells first, every wave explodes them together
+        to_explode = [(i, counts[i], owners[i]) for i in candidates
+                      if counts[i] >= CRITICAL_MASS_AT[i]]
+
+        if not to_explode:
+            candidates = []
+            break
+
+        changed = set()
+        for i, count, color in to_explode:
+            neighbors = NEIGHBORS_AT[i]
+            remaining = count - CRITICAL_MASS_AT[i]
+            new_owner = color if remaining > 0 else EMPTY
+            before = owners[i] << 8 | counts[i]
+            after = new_owner << 8 | remaining
+            record(i << 16 | before)
+            keys = ZOBRIST_AT[i]
+            h ^= keys[before] ^ keys[after]
+            terms = TERMS_AT[i]
+            t += terms[after] - terms[before]
+            orbs[owners[i]] -= counts[i]
+            orbs[color] += remaining + len(neighbors)
+            counts[i] = remaining
+            owners[i] = new_owner
+            changed.add(i)
+
+            for j in neighbors:
+                owner = owners[j]
+                count_j = counts[j]
+                before = owner << 8 | count_j
+                after = color << 8 | count_j + 1
+                record(j << 16 | before)
+                keys = ZOBRIST_AT[j]
+                h ^= keys[before] ^ keys[after]
+                terms = TERMS_AT[j]
+                t += terms[after] - terms[before]
+                if owner != color:
+                    orbs[owner] -= count_j
+                    orbs[color] += count_j
+                    owners[j] = color
+                counts[j] = count_j + 1
+            changed.update(neighbors)
+
+        candidates = sorted(changed)
+
+        # Only whole waves count: a snapshot cell can still restore its color
+        if contested and not (orbs[RED] and orbs[BLUE]):
+            break
+    else:
+        print(f" Explosion stopped after maximum {max_iterations} iterations")
+
+    # Cells left unchecked by an early stop or the iteration limit stay pending
+    board.frontier = list(candidates)
+    board.hash = h
+    board.terms = t
+
+    return explosion_count
+
+def get_valid_moves(board, player_color):
+    """Get all valid moves for a player"""
+    opponent = OPPONENT[COLOR_CODE[player_color]]
+    owners = board.owners
+    return [CELL_COORDS[i] for i in CELL_RANGE if owners[i] != opponent]
+
+def get_explosive_moves(board, player_color):
+    """Moves onto a player's cells that are one orb from critical mass and next to an enemy cell"""
+    _, _, _, _, red_loaded, blue_loaded = unpack_terms(board.terms)
+    loaded = blue_loaded if player_color == 'B' else red_loaded
+    opponent = OPPONENT[COLOR_CODE[player_color]]
+    owners = board.owners
+    moves = []
+    while loaded:
+        low = loaded & -loaded
+        loaded ^= low
+        i = low.bit_length() - 1
+        for j in NEIGHBORS_AT[i]:
+            if owners[j] == opponent:
+                moves.append(CELL_COORDS[i])
+                break
+    return moves
+
+def apply_move(board, r, c, color):
+    """Apply a move to the board"""
+    i = r * COLS + c
+    code = COLOR_CODE[color]
+    owner = board.owners[i]
+    count = board.counts[i]
+    before = owner << 8 | count
+    after = code << 8 | count + 1
+    keys = ZOBRIST_AT[i]
+    board.hash ^= keys[before] ^ keys[after]
+    terms = TERMS_AT[i]
+    board.terms += terms[after] - terms[before]
+    if owner != code:
+        board.orbs[owner] -= count
+        board.orbs[code] += count
+        board.owners[i] = code
+    board.counts[i] = count + 1
+    board.orbs[code] += 1
+    board.frontier.append(i)
+
+def check_winner(board):
+    """Check if there's a winner from the running orb totals"""
+    red_exists = board.orbs[RED] > 0
+    blue_exists = board.orbs[BLUE] > 0
+
+    if red_exists and blue_exists:
+        return None
+
+    # Only declare winner if we have enough orbs on board (both players have played)
+    if board.orbs[RED] + board.orbs[BLUE] < 2:
+        return None
+
+    if red_exists:
+        return 'R'
+    elif blue_exists:
+        return 'B'
+    return None
+
+def make_move(board, r, c, color, max_iterations=1000):
+    """Apply a move and its chain reaction in place, undone by unmake_move
+
+    Pushes a frame with the prior state of every touched cell, packed as
+    index << 16 | owner << 8 | count, plus the orb totals, hash, terms and frontier,
+    so the search never copies the board. Returns the number of waves.
+    """
+    i = r * COLS + c
+    counts, owners, orbs = board.counts, board.owners, board.orbs
+    count, owner = counts[i], owners[i]
+    touched = [i << 16 | owner << 8 | count]
+    frontier = board.frontier
+    board.undo.append((touched, orbs[:], board.hash, board.terms, frontier))
+
+    # Same as apply_move; the saved frontier list is never modified
+    code = COLOR_CODE[color]
+    before = owner << 8 | count
+    after = code << 8 | count + 1
+    keys = ZOBRIST_AT[i]
+    board.hash ^= keys[before] ^ keys[after]
+    terms = TERMS_AT[i]
+    board.terms += terms[after] - terms[before]
+    if owner != code:
+        orbs[owner] -= count
+        orbs[code] += count
+        owners[i] = code
+    counts[i] = count + 1
+    orbs[code] += 1
+
+    if not frontier and count + 1 < CRITICAL_MASS_AT[i]:
+        return 1
+    board.frontier = frontier + [i]
+    return explode(board, max_iterations, touched)
+
+def unmake_move(board):
+    """Undo the last make_move"""
+    touched, orbs, hash, terms, frontier = board.undo.pop()
+    counts, owners = board.counts, board.owners
+    # Restore newest first so a cell touched several times ends at its oldest value
+    for cell in reversed(touched):
+        i = cell >> 16
+        counts[i] = cell & 0xFF
+        owners[i] = cell >> 8 & 0xFF
+    board.orbs = orbs
+    board.hash = hash
+    board.terms = terms
+    board.frontier = frontier
+
+def capture_move(board):
+    """The last make_move's result, for replay_move to redo it without exploding
+
+    Call before the unmake_move; holds the move's touched list and the
+    final state of each touched cell, the orb totals, hash, terms and frontier.
+    """
+    touched = board.undo[-1][0]
+    counts, owners = board.counts, board.owners
+    cells = [(i, owners[i], counts[i]) for i in {cell >> 16 for cell in touched}]
+    return touched, cells, board.orbs[:], board.hash, board.terms, board.frontier
+
+def replay_move(board, move):
+    """Redo a capture_move result on the position it was made from, undone by unmake_move"""
+    touched, cells, orbs, hash, terms, frontier = move
+    board.undo.append((touched, board.orbs, board.hash, board.terms, board.frontier))
+    counts, owners = board.counts, board.owners
+    for i, owner, count in cells:
+        owners[i] = owner
+        counts[i] = count
+    # make_move changes the orb totals in place, so the board gets its own copy
+    board.orbs = orbs[:]
+    board.hash = hash
+    board.terms = terms
+    board.frontier = frontier
@@ -0,0 +1,317 @@
+# engine/channel.py - message transport between the game processes
+import os
+import sys
+import time
+import ctypes
+import ctypes.util
+import select
+import struct
+import threading
+from multiprocessing.connection import Listener, Client
+
+from engine.board import ROWS
+
+# Environment variables main_menu sets for the processes it starts
+CHANNEL_ENV = "CHAIN_REACTION_CHANNEL"
+AUTHKEY_ENV = "CHAIN_REACTION_AUTHKEY"
+
+# Separates the header from the sequence number in gamestate.txt: "AI Move: #12"
+SEQ_MARK = " #"
+
+# inotify event mask bits and the fixed part of an event (wd, mask, cookie, len)
+IN_CLOSE_WRITE = 0x08
+IN_MOVED_TO = 0x80
+_INOTIFY_EVENT = struct.Struct('iIII')
+
+class MessageHub:
+    """Relay between the processes of one game, run by main_menu
+
+    Every message a process sends is forwarded to all the others at once.
+    The game's messages are kept and replayed in order to processes that
+    connect later, so a player or viewer that starts after the first moves
+    still sees every one of them. Messages are (header, lines) tuples: the
+    gamestate.txt header line and the board rows.
+    """
+
+    def __init__(self):
+        self.authkey = os.urandom(16)
+        self.listener = Listener(authkey=self.authkey)
+        self.connections = []
+        self.history = []
+        self.lock = threading.Lock()
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def env(self):
+        """Environment for subprocess.Popen that points the process at this hub"""
+        env = dict(os.environ)
+        env[CHANNEL_ENV] = self.listener.address
+        env[AUTHKEY_ENV] = self.authkey.hex()
+        return env
+
+    def _accept(self):
+        while True:
+            try:
+                conn = self.listener.accept()
+            except OSError:
+                return  # Listener closed
+            except Exception:
+                continue  # Failed handshake
+            with self.lock:
+                try:
+                    for message in self.history:
+                        conn.send(message)
+                except OSError:
+                    conn.close()
+                    continue
+                self.connections.append(conn)
+            threading.Thread(target=self._relay, args=(conn,), daemon=True).start()
+
+    def _relay(self, conn):
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                break
+            with self.lock:
+                self.history.append(message)
+                for other in self.connections:
+                    if other is not conn:
+                        try:
+                            other.send(message)
+                        except OSError:
+                            pass
+        with self.lock:
+            self.connections.remove(conn)
+        conn.close()
+
+    def close(self):
+        """Stop accepting and drop all connections"""
+        self.listener.close()
+        with self.lock:
+            for conn in self.connections:
+                conn.close()
+
+class SocketChannel:
+    """Connection to the MessageHub: blocking reads, no polling"""
+
+    def __init__(self, address, authkey):
+        self.conn = Client(address, authkey=authkey)
+
+    def send(self, header, lines):
+        """Send a message, returns False if the hub is gone"""
+        try:
+            self.conn.send((header, lines))
+            return True
+        except OSError:
+            return False
+
+    def receive(self, headers):
+        """Wait for a message whose header starts with one of headers
+
+        Returns (header, lines), or (None, None) once the hub has closed.
+        """
+        while True:
+            try:
+                header, lines = self.conn.recv()
+            except (EOFError, OSError):
+                return None, None
+            if header.startswith(headers):
+                return header, lines
+
+    def poll(self):
+        """Next message without blocking, or (None, None)"""
+        try:
+            if self.conn.poll():
+                return self.conn.recv()
+        except (EOFError, OSError):
+            pass
+        return None, None
+
+    def pause(self, seconds):
+        """No wait: the hub replays the game to late joiners and the viewers pace the display"""
+
+def write_state_file(filename, header, lines, seq):
+    """Write a game state file atomically, with seq appended to the header line
+
+    The state goes to a temp file next to filename that then replaces it,
+    so a reader always sees either the previous or the new file, never a
+    partly written one.
+    """
+    tmp = f"{filename}.{os.getpid()}.tmp"
+    with open(tmp, 'w') as f:
+        f.write('\n'.join([f"{header}{SEQ_MARK}{seq}"] + lines) + '\n')
+    for attempt in range(10):
+        try:
+            os.replace(tmp, filename)
+            return
+        except PermissionError:
+            # Windows refuses to replace a file another process has open
+            time.sleep(0.01)
+    os.replace(tmp, filename)
+
+def read_state_file(filename):
+    """Read a game state file, returns (seq, header, lines) or None
+
+    Files without a sequence number, from older versions, have seq 0.
+    """
+    try:
+        with open(filename, 'r') as f:
+            content = f.read()
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Error reading file: {e}")
+        return None
+    lines = content.splitlines()
+    if len(lines) < ROWS + 1:
+        return None
+    header, mark, seq = lines[0].strip().rpartition(SEQ_MARK)
+    if not mark or not seq.isdigit():
+        return 0, lines[0].strip(), lines[1:1+ROWS]
+    return int(seq), header, lines[1:1+ROWS]
+
+class FileWatcher:
+    """Wait for a file to change: inotify on Linux, os.stat polling elsewhere
+
+    Changes made after the watcher was created are never missed: wait()
+    returns at once if the file changed since the previous wait().
+    """
+
+    def __init__(self, filename, interval=0.05):
+        self.filename = filename
+        self.name = os.path.basename(filename).encode()
+        self.interval = interval
+        self.fd = _inotify_watch(os.path.dirname(os.path.abspath(filename)))
+        self.signature = self._stat()
+
+    def _stat(self):
+        try:
+            st = os.stat(self.filename)
+            return st.st_ino, st.st_mtime_ns, st.st_size
+        except OSError:
+            return None
+
+    def wait(self, timeout=None):
+        """Block until the file may have changed, False on timeout"""
+        if self.fd is not None:
+            while True:
+                ready, _, _ = select.select([self.fd], [], [], timeout)
+                if not ready:
+                    return False
+                if self._read_events():
+                    return True
+        
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            signature = self._stat()
+            if signature != self.signature:
+                self.signature = signature
+                return True
+            if deadline is not None and time.time() >= deadline:
+                return False
+            time.sleep(self.interval)
+
+    def _read_events(self):
+        """Drain the inotify queue, True if an event was for our file"""
+        try:
+            data = os.read(self.fd, 4096)
+        except BlockingIOError:
+            return False
+        found = False
+        offset = 0
+        while offset < len(data):
+            _, _, _, length = _INOTIFY_EVENT.unpack_from(data, offset)
+            offset += _INOTIFY_EVENT.size
+            if data[offset:offset + length].rstrip(b'\0') == self.name:
+                found = True
+            offset += length
+        return found
+
+    def close(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+class FileChannel:
+    """Compatibility transport: messages go through gamestate.txt
+
+    Every write gets the next sequence number, so each reader sees every
+    state once; readers sleep in a FileWatcher between changes.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.watcher = FileWatcher(filename)
+        self.seq = 0
+        self.checked = False
+
+    def send(self, header, lines):
+        """Write the message to the file"""
+        try:
+            self.seq += 1
+            write_state_file(self.filename, header, lines, self.seq)
+            return True
+        except Exception as e:
+            print(f"Error writing file: {e}")
+            return False
+
+    def _next(self):
+        """State in the file if it is newer than any seen or sent, else None"""
+        state = read_state_file(self.filename)
+        if state is None or (state[0] and state[0] <= self.seq):
+            return None
+        self.seq = max(self.seq, state[0])
+        return state
+
+    def receive(self, headers):
+        """Wait for a new state whose header starts with one of headers"""
+        while True:
+            state = self._next()
+            if state is not None and state[1].startswith(headers):
+                return state[1], state[2]
+            # The timeout is only a safety net in case an event is lost
+            self.watcher.wait(1.0)
+
+    def poll(self):
+        """New state in the file, or (None, None)"""
+        if self.checked and not self.watcher.wait(0):
+            return None, None
+        self.checked = True
+        state = self._next()
+        if state is None:
+            return None, None
+        return state[1], state[2]
+
+    def pause(self, seconds):
+        """Give the other processes time to see the file change"""
+        time.sleep(seconds)
+
+def _inotify_watch(directory):
+    """inotify descriptor watching directory for replaced files, None if unavailable"""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return None
+        if libc.inotify_add_watch(fd, directory.encode(), IN_CLOSE_WRITE | IN_MOVED_TO) < 0:
+            os.close(fd)
+            return None
+        return fd
+    except (OSError, AttributeError):
+        return None
+
+def open_channel(filename="gamestate.txt"):
+    """Channel to the other game processes
+
+    Uses the hub main_menu started if there is one, otherwise (a process
+    started by hand, or "transport": "file" in the config) gamestate.txt.
+    """
+    address = os.environ.get(CHANNEL_ENV)
+    if address:
+        try:
+            return SocketChannel(address, bytes.fromhex(os.environ[AUTHKEY_ENV]))
+        except Exception as e:
+            print(f"Could not connect to the game hub ({e}), using {filename}")
+    return FileChannel(filename)
@@ -0,0 +1,68 @@
+# engine/evaluate.py - board evaluation for the minimax search
+from engine.board import RED, BLUE, NEIGHBORS_AT, unpack_terms
+from engine.levels import LEVEL_CONFIG
+
+# Mobility weights: per occupied cell (the legal-move difference, as both sides may play
+# the empty cells), per cell one orb from critical mass
+MOBILITY_WEIGHT = 0.25
+LOADED_WEIGHT = 0.5
+
+def quick_evaluate(board, color='B'):
+    """Fast evaluation function for quick decisions, from color's point of view
+
+    Per cell: its orbs, 0.3 times its position weight and 0.5 times its
+    fill toward critical mass. The per-cell sums are kept by the board in
+    Board.terms as integers (see engine.board.TERMS_AT) and scaled here,
+    which engine.vectorized repeats to the last bit.
+    """
+    critical, _, placed, _, _, _ = unpack_terms(board.terms)
+    score = (board.orbs[BLUE] - board.orbs[RED]) + placed * 0.3 + critical / 24
+    return score if color == 'B' else -score
+
+def conversion_potential(board, loaded, enemy):
+    """Enemy orbs next to the cells of a loaded mask from unpack_terms"""
+    counts, owners = board.counts, board.owners
+    total = 0
+    while loaded:
+        low = loaded & -loaded
+        loaded ^= low
+        for j in NEIGHBORS_AT[low.bit_length() - 1]:
+            if owners[j] == enemy:
+                total += counts[j]
+    return total
+
+def evaluate_board(board, level, color='B'):
+    """Evaluate board position based on difficulty level, from color's point of view
+
+    Every term is symmetric, so the score is computed for Blue and negated
+    for Red. The linear terms and mobility come from Board.terms, only
+    conversion potential looks at cells, those one orb from critical mass.
+    """
+    if level <= 2:
+        return quick_evaluate(board, color)
+    
+    heuristics = LEVEL_CONFIG[level].get("heuristics", ())
+    critical, strategic, _, occupied, red_loaded, blue_loaded = unpack_terms(board.terms)
+    
+    # Simple orb count (always included)
+    score = board.orbs[BLUE] - board.orbs[RED]
+    
+    # Critical mass proximity: 1.5 per full cell, 1.5 / 12 per twelfth
+    if "critical_mass" in heuristics:
+        score += critical * 0.125
+    
+    # Strategic positions (use pre-calculated weights)
+    if "strategic_position" in heuristics:
+        score += strategic * 0.4
+    
+    # Enemy orbs next to a cell one orb from exploding
+    if level >= 4 and "conversion_potential" in heuristics:
+        score += conversion_potential(board, blue_loaded, RED) - conversion_potential(board, red_loaded, BLUE)
+    
+    # Mobility: occupied-cell difference (Blue minus Red) times MOBILITY_WEIGHT, plus
+    # the difference in cells one orb from critical mass times LOADED_WEIGHT
+    if "mobility" in heuristics:
+        loaded = bin(blue_loaded).count('1') - bin(red_loaded).count('1')
+        score += occupied * MOBILITY_WEIGHT + loaded * LOADED_WEIGHT
+    
+    return score if color == 'B' else -score
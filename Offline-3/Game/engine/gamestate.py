@@ -0,0 +1,28 @@
+# engine/gamestate.py - game state messages and configuration shared by the players
+import os
+import json
+
+from engine.board import parse_board, board_to_lines
+
+CONFIG_FILE = "game_config.json"
+
+def load_game_config(default=None):
+    """Load game configuration, falling back to default"""
+    if os.path.exists(CONFIG_FILE):
+        try:
+            with open(CONFIG_FILE, 'r') as f:
+                return json.load(f)
+        except:
+            pass
+    return dict(default) if default else {"level": 1}
+
+def send_gamestate(channel, header, board):
+    """Send game state to the other processes"""
+    return channel.send(header, board_to_lines(board))
+
+def receive_gamestate(channel, expected_header):
+    """Wait for a game state with the expected header, None once the channel has closed"""
+    header, lines = channel.receive(expected_header)
+    if header is None:
+        return None
+    return parse_board(lines)
@@ -0,0 +1,17 @@
+# engine/levels.py - difficulty levels shared by all AI players
+
+# Level configurations - optimized for speed. An optional "search" key picks the node
+# search, "alphabeta" (the default) or "pvs", see engine.search.NODE_SEARCHES, and
+# "quiescence" how many plies of explosive moves engine.search.quiescence adds at the leaves.
+# "algorithm" is "minimax" unless given; "mcts" makes a Monte Carlo tree search level
+# instead (engine.mcts), with "simulations" per move and a "playout" policy, "random" or "smart".
+# Level 6 is such an engine for match.py and tournament.py, not a difficulty: it loses to
+# level 1 and takes far longer, so the menus only offer levels 1-5.
+LEVEL_CONFIG = {
+    1: {"name": "Beginner", "depth": 1, "heuristics": ["orb_count"]},
+    2: {"name": "Easy", "depth": 2, "heuristics": ["orb_count", "critical_mass"]},
+    3: {"name": "Medium", "depth": 2, "heuristics": ["orb_count", "critical_mass", "strategic_position"]},
+    4: {"name": "Hard", "depth": 2, "heuristics": ["orb_count", "critical_mass", "strategic_position", "conversion_potential"]},
+    5: {"name": "Expert", "depth": 2, "quiescence": 2, "heuristics": ["orb_count", "critical_mass", "strategic_position", "conversion_potential", "mobility"]},
+    6: {"name": "Monte Carlo", "algorithm": "mcts", "simulations": 1000, "playout": "random"}
+}
@@ -0,0 +1,118 @@
+# engine/match.py - headless matches between AI agents in one process
+import time
+import random
+
+from engine.board import Board, OPPONENT_COLOR, get_valid_moves, apply_move, explode, check_winner
+from engine.levels import LEVEL_CONFIG
+from engine.transposition import TranspositionTable
+from engine.search import WinCheckCache
+from engine.parallel import get_search
+from engine.player import decide_move
+
+# Plies after which an unfinished game is scored as a draw
+MAX_PLIES = 1000
+
+class RandomAgent:
+    """random_ai_player: a uniformly random valid move"""
+
+    def __init__(self, seed=None):
+        self.name = "random"
+        self.rng = random.Random(seed)
+
+    def choose_move(self, board, color):
+        """Returns (move, score, depth)"""
+        return self.rng.choice(get_valid_moves(board, color)), 0, 0
+
+class SearchAgent:
+    """The search players (ai/smart/heuristic) at one level
+
+    Plays like their main loops, through engine.player.decide_move: an
+    immediate win if there is one, else the level's search, minimax at
+    fixed depth or iterative deepening with move_time, or Monte Carlo.
+    With search_log set, every search appends its statistics to that file.
+    seed seeds the Monte Carlo playouts and the random fallback move, so
+    games without move_time replay exactly.
+    """
+
+    def __init__(self, level, move_time=None, workers=1, parallel="root", name=None, search_log=None, seed=None):
+        if level not in LEVEL_CONFIG:
+            raise ValueError(f"Unknown level {level}")
+        self.name = name or f"level{level}"
+        self.level = level
+        self.move_time = move_time
+        self.tt = TranspositionTable()
+        self.wins = WinCheckCache()
+        self.search = get_search(workers, parallel, level)
+        self.search_log = search_log
+        self.rng = random.Random(seed)
+
+    def choose_move(self, board, color):
+        """Returns (move, score, depth)"""
+        move, score, depth, _ = decide_move(board, get_valid_moves(board, color), self.level, color, self.tt,
+                                            self.move_time, self.search, self.search_log, self.name, self.rng,
+                                            self.wins)
+        return move, score, depth
+
+def make_agent(spec, seed=None, move_time=None, workers=1, parallel="root", search_log=None):
+    """Agent from a spec: "random", or "smart:N" / "heuristic:N" / "levelN" for level N"""
+    if spec == "random":
+        return RandomAgent(seed)
+    kind, _, level = spec.partition(":")
+    if kind.startswith("level"):
+        kind, level = "level", kind[len("level"):]
+    if kind not in ("smart", "heuristic", "level") or not level.isdigit():
+        raise ValueError(f"Unknown agent {spec!r}, expected random, smart:N, heuristic:N or levelN")
+    return SearchAgent(int(level), move_time, workers, parallel, spec, search_log, seed)
+
+def play_match(red, blue, opening=(), max_plies=MAX_PLIES):
+    """Play one game, red moves first; returns a result dict
+
+    opening is a list of (r, c) moves played before the agents take over,
+    alternating from Red. The result holds the winner ('R', 'B' or None
+    for a draw at max_plies), the reason, and every move as
+    {"color", "move", "time", "score", "depth"}.
+    """
+    agents = {'R': red, 'B': blue}
+    board = Board()
+    color = 'R'
+    moves = []
+    winner = None
+    reason = "max_plies"
+    start_time = time.time()
+
+    for ply in range(max_plies):
+        valid_moves = get_valid_moves(board, color)
+        if not valid_moves:
+            winner, reason = OPPONENT_COLOR[color], "no_moves"
+            break
+
+        think_start = time.time()
+        if ply < len(opening):
+            move, score, depth = tuple(opening[ply]), 0, 0
+            if move not in valid_moves:
+                raise ValueError(f"Opening move {move} is not valid for {color}")
+        else:
+            move, score, depth = agents[color].choose_move(board, color)
+        think_time = time.time() - think_start
+
+        apply_move(board, move[0], move[1], color)
+        explode(board, max_iterations=1000)
+        moves.append({"color": color, "move": move, "time": think_time, "score": score, "depth": depth})
+
+        # Like the players, neither side checks for a winner on its first move
+        if ply >= 2:
+            winner = check_winner(board)
+            if winner:
+                reason = "elimination"
+                break
+        color = OPPONENT_COLOR[color]
+
+    return {
+        "red": red.name,
+        "blue": blue.name,
+        "winner": winner,
+        "reason": reason,
+        "plies": len(moves),
+        "duration": time.time() - start_time,
+        "moves": moves,
+    }
@@ -0,0 +1,151 @@
+# engine/mcts.py - Monte Carlo tree search, the rollout-based alternative to minimax
+import math
+import time
+import random
+
+from engine.board import (
+    ROWS, COLS, CELL_RANGE, CELL_COORDS, COLOR_CODE, OPPONENT, OPPONENT_COLOR,
+    get_valid_moves, apply_move, explode, check_winner,
+)
+from engine.search import SEARCH_MAX_ITERATIONS
+
+# UCT exploration constant, sqrt(2) for results between 0 and 1
+EXPLORATION = math.sqrt(2)
+
+# Plies after which a playout that hasn't finished counts as a draw
+MAX_PLAYOUT_PLIES = 500
+
+# Corner, edge and center cells, in get_smart_random_move's order of preference
+_EDGE_ROWS, _EDGE_COLS = (0, ROWS - 1), (0, COLS - 1)
+CELLS_BY_PREFERENCE = (
+    [i for i in CELL_RANGE if CELL_COORDS[i][0] in _EDGE_ROWS and CELL_COORDS[i][1] in _EDGE_COLS],
+    [i for i in CELL_RANGE if (CELL_COORDS[i][0] in _EDGE_ROWS) != (CELL_COORDS[i][1] in _EDGE_COLS)],
+    [i for i in CELL_RANGE if CELL_COORDS[i][0] not in _EDGE_ROWS and CELL_COORDS[i][1] not in _EDGE_COLS],
+)
+
+def random_move(board, color, rng):
+    """Uniformly random valid move, as random_ai_player plays, or None"""
+    moves = get_valid_moves(board, color)
+    return rng.choice(moves) if moves else None
+
+def smart_move(board, color, rng):
+    """get_smart_random_move's move, without listing every valid move, or None"""
+    opponent = OPPONENT[COLOR_CODE[color]]
+    owners = board.owners
+    for cells in CELLS_BY_PREFERENCE:
+        moves = [i for i in cells if owners[i] != opponent]
+        if moves:
+            return CELL_COORDS[rng.choice(moves)]
+    return None
+
+# Playout policies: (board, color, rng) -> move
+PLAYOUT_POLICIES = {"random": random_move, "smart": smart_move}
+
+class Node:
+    """A position in the search tree, reached by move
+
+    color made the move, so wins counts the playouts through this node
+    that color won, draws as half. untried holds the moves of the side
+    to move that have no child yet, None until the node is first visited.
+    """
+
+    __slots__ = ("move", "color", "parent", "children", "untried", "visits", "wins")
+
+    def __init__(self, move, color, parent=None):
+        self.move = move
+        self.color = color
+        self.parent = parent
+        self.children = []
+        self.untried = None
+        self.visits = 0
+        self.wins = 0.0
+
+    def select_child(self, exploration):
+        """Child with the highest upper confidence bound (UCT)"""
+        log_visits = math.log(self.visits)
+        return max(self.children,
+                   key=lambda child: child.wins / child.visits + exploration * math.sqrt(log_visits / child.visits))
+
+def play(board, r, c, color):
+    """Make a move on a playout board, no undo; returns the winner or None"""
+    apply_move(board, r, c, color)
+    explode(board, max_iterations=SEARCH_MAX_ITERATIONS)
+    return check_winner(board)
+
+def playout(board, color, policy, rng, max_plies=MAX_PLAYOUT_PLIES):
+    """Play the game out from board with color to move, returns the winner or None for a draw"""
+    for _ in range(max_plies):
+        move = policy(board, color, rng)
+        if move is None:
+            return OPPONENT_COLOR[color]
+        winner = play(board, move[0], move[1], color)
+        if winner:
+            return winner
+        color = OPPONENT_COLOR[color]
+    return None
+
+def mcts_search(board, color, simulations=1000, move_time=None, playout_policy="random", exploration=EXPLORATION,
+                rng=None, stats=None):
+    """UCT search for color's move, returns (score, move, depth)
+
+    Each simulation walks down the tree by the upper confidence bound,
+    adds one child, plays the game out on a copy of the board with the
+    playout policy ("random" or "smart", see PLAYOUT_POLICIES) and counts
+    the result along the path. The budget is simulations, or move_time
+    seconds if given. The move is the most visited one; score is its mean
+    result for color, from -1 (lost every playout) to 1, and depth the
+    deepest tree ply reached. stats counts the playouts.
+    """
+    policy = PLAYOUT_POLICIES[playout_policy]
+    rng = rng or random.Random()
+    root = Node(None, OPPONENT_COLOR[color])
+    deadline = time.time() + move_time if move_time else None
+    done = max_depth = 0
+
+    while (time.time() < deadline) if deadline is not None else done < simulations:
+        node, child_board, to_move, winner, depth = root, board.copy(), color, None, 0
+
+        # Selection: down through fully expanded nodes
+        while node.untried == [] and node.children:
+            node = node.select_child(exploration)
+            winner = play(child_board, node.move[0], node.move[1], to_move)
+            to_move = OPPONENT_COLOR[to_move]
+            depth += 1
+
+        # Expansion: one new child, unless the game is over
+        if winner is None:
+            if node.untried is None:
+                node.untried = get_valid_moves(child_board, to_move)
+            if node.untried:
+                move = node.untried.pop(rng.randrange(len(node.untried)))
+                child = Node(move, to_move, node)
+                node.children.append(child)
+                node = child
+                winner = play(child_board, move[0], move[1], to_move)
+                to_move = OPPONENT_COLOR[to_move]
+                depth += 1
+            elif not node.children:
+                # No moves at all: the board is the opponent's
+                winner = OPPONENT_COLOR[to_move]
+
+        # Simulation
+        if winner is None:
+            winner = playout(child_board, to_move, policy, rng)
+
+        # Backpropagation
+        while node is not None:
+            node.visits += 1
+            if winner == node.color:
+                node.wins += 1.0
+            elif winner is None:
+                node.wins += 0.5
+            node = node.parent
+        done += 1
+        max_depth = max(max_depth, depth)
+
+    if stats is not None:
+        stats.playouts += done
+    if not root.children:
+        return 0.0, None, 0
+    best = max(root.children, key=lambda child: child.visits)
+    return 2 * best.wins / best.visits - 1, best.move, max_depth
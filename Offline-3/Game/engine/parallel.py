@@ -0,0 +1,266 @@
+# engine/parallel.py - parallel searches over a process pool
+import math
+import atexit
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from engine.board import Board, get_valid_moves, make_move, unmake_move
+from engine.levels import LEVEL_CONFIG
+from engine.search import (
+    WIN_SCORE, SEARCH_MAX_ITERATIONS, SearchTimeout, MoveHistory,
+    find_winning_move, order_moves, node_search, aspiration_search, search_root,
+)
+from engine.transposition import EXACT, position_key, TranspositionTable, SharedTranspositionTable
+from engine.stats import SearchStats
+
+# Per-worker state, set up by _init_worker in every pool process
+_shared_alpha = None
+_shared_generation = None
+_worker_tt = None
+_worker_generation = None
+_worker_context = None
+_worker_board = None
+_worker_history = None
+_shared_table = None
+_stop_flag = None
+
+def _init_worker(shared_alpha, shared_generation):
+    """Pool initializer: keep the shared alpha and generation and give the worker its own table"""
+    global _shared_alpha, _shared_generation, _worker_tt
+    _shared_alpha = shared_alpha
+    _shared_generation = shared_generation
+    _worker_tt = TranspositionTable()
+
+def _search_root_move(counts, owners, move, depth, level, color, generation, deadline, instrument):
+    """Search one root move in a worker, returns (move, score, stats)
+
+    The search starts just below the best root score published so far,
+    so a move that ties it still comes back exact, and publishes its own
+    score if it beats it. score is None on timeout or if the search the
+    task belongs to is over, stats a SearchStats.as_dict() if instrument
+    is set. The root board and the killer moves and history scores are
+    kept for the worker's next root move of the same search.
+    """
+    global _worker_generation, _worker_context, _worker_board, _worker_history
+    if generation != _shared_generation.value:
+        return move, None, None
+    if generation != _worker_generation:
+        # Stored scores are only valid for the level and color they were searched for
+        if (level, color) != _worker_context:
+            _worker_tt.clear()
+            _worker_context = (level, color)
+        _worker_tt.new_search()
+        _worker_generation = generation
+        _worker_board = Board(bytearray(counts), bytearray(owners))
+        _worker_board.refresh()
+        _worker_history = MoveHistory()
+    
+    board = _worker_board
+    # Same table gating as the serial search
+    tt = _worker_tt if depth >= 3 or deadline is not None else None
+    
+    stats = SearchStats() if instrument else None
+    alpha = math.nextafter(_shared_alpha.value, float('-inf'))
+    r, c = move
+    make_move(board, r, c, color, max_iterations=SEARCH_MAX_ITERATIONS)
+    try:
+        score, _ = node_search(level)(board, depth - 1, alpha, float('inf'), False, level, color, tt,
+                                      deadline, stats, _worker_history)
+    except SearchTimeout:
+        return move, None, None
+    finally:
+        unmake_move(board)
+    
+    # A task left over from a timed-out search must not raise the next one's alpha
+    with _shared_alpha.get_lock():
+        if generation == _shared_generation.value and score > _shared_alpha.value:
+            _shared_alpha.value = score
+    return move, score, stats.as_dict() if instrument else None
+
+class ParallelSearch:
+    """Root-splitting search: the root moves are shared out over a process pool
+
+    The best-ordered root move is searched first to get a bound, then the
+    rest in parallel. Workers read the best root score found so far from a
+    shared value and use it as their alpha, so a good move found by one
+    worker makes the others prune more. Every move scoring as high as the
+    best is searched exactly, whatever the order the workers finish in,
+    and ties go to the earliest in the move order, so the move chosen
+    doesn't depend on the scheduling.
+    """
+
+    def __init__(self, workers):
+        self.workers = workers
+        self.alpha = multiprocessing.Value('d', float('-inf'))
+        # Search the workers may publish to, only changed under the alpha's lock
+        self.current = multiprocessing.RawValue('q', 0)
+        self.pool = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(self.alpha, self.current))
+        self.generation = 0
+        atexit.register(self.close)
+
+    def search_root(self, board, depth, level, color='B', tt=None, deadline=None, stats=None, guess=None,
+                    wins=None):
+        """Drop-in replacement for engine.search.search_root, returns (score, move)
+
+        tt is only used in this process, to order the root moves by the
+        best move of an earlier search. stats gets the workers' counts
+        and times added up. guess is ignored: the root moves are searched
+        apart, each with the best root score so far as its alpha. wins is
+        a WinCheckCache for the root's win check, made in this process.
+        """
+        valid_moves = get_valid_moves(board, color)
+        if not valid_moves:
+            return -WIN_SCORE - depth, None
+        winning_move = find_winning_move(board, valid_moves, color, cache=wins, stats=stats)
+        if winning_move is not None:
+            return WIN_SCORE + depth, winning_move
+        
+        key = position_key(board, True)
+        entry = tt.probe(key) if tt is not None else None
+        order_moves(board, valid_moves, entry[4] if entry is not None else None)
+        
+        self.generation += 1
+        with self.alpha.get_lock():
+            self.current.value = self.generation
+            self.alpha.value = float('-inf')
+        counts, owners = bytes(board.counts), bytes(board.owners)
+        args = (depth, level, color, self.generation, deadline, stats is not None)
+        
+        # Young brothers wait: the first move alone, then the rest together
+        results = [self.pool.submit(_search_root_move, counts, owners, valid_moves[0], *args).result()]
+        if results[0][1] is None:
+            raise SearchTimeout()
+        futures = [self.pool.submit(_search_root_move, counts, owners, move, *args)
+                   for move in valid_moves[1:]]
+        try:
+            for future in futures:
+                results.append(future.result())
+                if results[-1][1] is None:
+                    raise SearchTimeout()
+        except SearchTimeout:
+            for future in futures:
+                future.cancel()
+            raise
+        
+        # Scores below the best are only bounds but never win; the best is exact
+        # for every move that reaches it, so the first of those in move order wins
+        best_score, best_move = float('-inf'), None
+        for move, score, worker_stats in results:
+            if stats is not None:
+                stats.merge(worker_stats)
+            if best_move is None or score > best_score:
+                best_score, best_move = score, move
+        
+        if tt is not None:
+            tt.store(key, depth, EXACT, best_score, best_move)
+        return best_score, best_move
+
+    def close(self):
+        """Shut the worker processes down"""
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+class StopSignal:
+    """Deadline for a helper search that also expires when the stop flag is set
+
+    check_deadline compares time.time() > deadline, which Python evaluates
+    as deadline < time.time(), so this object can stand in for the number.
+    """
+
+    def __init__(self, flag, deadline=None):
+        self.flag = flag
+        self.deadline = deadline
+
+    def __lt__(self, now):
+        return self.flag.value or (self.deadline is not None and now > self.deadline)
+
+def _init_helper(table_name, stop_flag):
+    """Pool initializer: attach to the shared table and the stop flag"""
+    global _shared_table, _stop_flag
+    _shared_table = SharedTranspositionTable(name=table_name)
+    _stop_flag = stop_flag
+
+def _helper_search(counts, owners, depth, level, color, deadline):
+    """Search the root position in a helper until done or told to stop
+
+    Returns the depth completed, or None if the search was stopped.
+    """
+    board = Board(bytearray(counts), bytearray(owners))
+    board.refresh()
+    try:
+        node_search(level)(board, depth, float('-inf'), float('inf'), True, level, color, _shared_table,
+                           StopSignal(_stop_flag, deadline), None, MoveHistory())
+    except SearchTimeout:
+        return None
+    return depth
+
+class LazySMPSearch:
+    """Lazy SMP: helper processes search the same position through one shared table
+
+    The helpers have no work split between them. Each one searches the
+    whole root position, half of them one ply deeper than asked, and the
+    entries they store cut off and order the main search, which runs in
+    this process. The helpers are stopped when the main search is done.
+    The shared table is only valid for one level and color, like a
+    player process.
+    """
+
+    def __init__(self, workers, size_bits=18):
+        self.workers = workers
+        self.table = SharedTranspositionTable(size_bits)
+        self.stop = multiprocessing.RawValue('b', 0)
+        self.pool = ProcessPoolExecutor(workers - 1, initializer=_init_helper,
+                                        initargs=(self.table.name, self.stop))
+        self.root_key = None
+        atexit.register(self.close)
+
+    def search_root(self, board, depth, level, color='B', tt=None, deadline=None, stats=None, guess=None,
+                    wins=None):
+        """Drop-in replacement for engine.search.search_root, returns (score, move)
+
+        tt is ignored, all processes use the shared table. stats only
+        covers the main search, not the helpers, which always search the
+        full window; the main search uses an aspiration window around guess,
+        and wins as the root's WinCheckCache.
+        """
+        key = position_key(board, True)
+        if key != self.root_key:
+            self.table.new_search()
+            self.root_key = key
+        
+        self.stop.value = 0
+        counts, owners = bytes(board.counts), bytes(board.owners)
+        helpers = [self.pool.submit(_helper_search, counts, owners, depth + (i % 2 == 0), level, color, deadline)
+                   for i in range(self.workers - 1)]
+        try:
+            if guess is not None:
+                return aspiration_search(node_search(level), board, depth, level, color, self.table, deadline,
+                                         stats, guess, wins)
+            return node_search(level)(board, depth, float('-inf'), float('inf'), True, level, color,
+                                      self.table, deadline, stats, MoveHistory(wins))
+        finally:
+            self.stop.value = 1
+            for helper in helpers:
+                helper.result()
+
+    def close(self):
+        """Shut the helpers down and free the shared table"""
+        if self.pool is not None:
+            self.stop.value = 1
+            self.pool.shutdown()
+            self.pool = None
+            self.table.close()
+
+# Parallel search modes selectable with the "parallel" config setting
+PARALLEL_MODES = {"root": ParallelSearch, "lazy_smp": LazySMPSearch}
+
+def get_search(workers=1, mode="root", level=None):
+    """Root search function for the configured number of worker processes
+
+    A level that doesn't run a minimax search, like the Monte Carlo one,
+    never uses the root search, so it gets search_root and no pool.
+    """
+    if workers <= 1 or (level is not None and LEVEL_CONFIG[level].get("algorithm", "minimax") != "minimax"):
+        return search_root
+    return PARALLEL_MODES[mode](workers).search_root
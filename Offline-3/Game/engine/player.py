@@ -0,0 +1,58 @@
+# engine/player.py - the move decision shared by the AI players and engine.match
+import time
+import random
+
+from engine.levels import LEVEL_CONFIG
+from engine.search import WIN_SCORE, find_winning_move, search_root, search_best_move, get_smart_random_move
+from engine.mcts import mcts_search
+from engine.stats import SearchStats, write_search_log
+
+def describe_level(level, move_time=None):
+    """The lines the AI players print about their level's search at startup"""
+    config = LEVEL_CONFIG[level]
+    if config.get("algorithm", "minimax") == "mcts":
+        lines = [f"Monte Carlo tree search with {config['playout']} playouts"]
+        if move_time:
+            lines.append(f"Time budget: {move_time}s per move")
+        else:
+            lines.append(f"Simulations: {config['simulations']} per move")
+        return lines
+    lines = [f"Using heuristics: {', '.join(config['heuristics'])}"]
+    if move_time:
+        lines.append(f"Time budget: {move_time}s per move (iterative deepening)")
+    else:
+        lines.append(f"Search depth: {config['depth']}")
+    return lines
+
+def decide_move(board, valid_moves, level, color, tt=None, move_time=None, search=search_root, search_log=None,
+                player="AI", rng=None, wins=None):
+    """Move for color out of valid_moves: an immediate win if there is one, else the level's search
+
+    Returns (move, score, depth, strategy), strategy being "winning",
+    the level's "algorithm" ("minimax" or "mcts"), or "random" for the
+    smart random move played when the search finds none. tt, move_time
+    and search are as in search_best_move; a Monte Carlo level searches
+    for its "simulations" or move_time and uses neither tt nor search.
+    With search_log set, the search appends its statistics to that file
+    under the player's name. rng, a random.Random, makes the playouts and
+    the random fallback reproducible; the random module is used without it.
+    wins, a WinCheckCache, lets the search's root reuse the win check made here.
+    """
+    winning_move = find_winning_move(board, valid_moves, color, cache=wins)
+    if winning_move:
+        return winning_move, WIN_SCORE, 0, "winning"
+
+    stats = SearchStats() if search_log else None
+    config = LEVEL_CONFIG[level]
+    algorithm = config.get("algorithm", "minimax")
+    start_time = time.time()
+    if algorithm == "mcts":
+        score, move, depth = mcts_search(board, color, config["simulations"], move_time, config["playout"],
+                                         rng=rng, stats=stats)
+    else:
+        score, move, depth = search_best_move(board, level, color, tt, move_time, search, stats, wins)
+    if stats is not None:
+        write_search_log(search_log, player, level, depth, move, score, time.time() - start_time, stats)
+    if move is None:
+        return get_smart_random_move(valid_moves, rng or random), 0, depth, "random"
+    return move, score, depth, algorithm
@@ -0,0 +1,582 @@
+# engine/search.py - minimax search shared by all AI players
+import time
+import random
+
+from engine.board import (
+    ROWS, COLS, CELLS, CRITICAL_MASS_AT, POSITION_WEIGHT_AT, COLOR_CODE, OPPONENT_COLOR,
+    get_valid_moves, get_explosive_moves, check_winner, make_move, unmake_move, capture_move, replay_move,
+)
+from engine.evaluate import evaluate_board
+from engine.levels import LEVEL_CONFIG
+from engine.transposition import EXACT, LOWER, UPPER, position_key
+from engine.stats import COUNTERS
+
+# Deepest iteration the driver will start, whatever the time budget
+MAX_DEPTH = 32
+
+# Scores at or beyond this are forced wins/losses, deeper search can't change them
+WIN_SCORE = 1000
+
+# Explosion wave limits for moves simulated inside the search
+SEARCH_MAX_ITERATIONS = 1000
+WIN_CHECK_MAX_ITERATIONS = 100
+
+# Width of principal_variation_search's null windows, below the gap between any two scores
+NULL_WINDOW = 1e-6
+
+# Aspiration windows: first half-width around the expected score, and the factor it
+# grows by each time the score falls outside; past WIN_SCORE that side is left open
+ASPIRATION_WINDOW = 4.0
+ASPIRATION_GROWTH = 4
+
+class SearchTimeout(Exception):
+    """Raised inside the search once the move deadline has passed"""
+
+def check_deadline(deadline):
+    """Abort the running iteration if the deadline has passed"""
+    if deadline is not None and time.time() > deadline:
+        raise SearchTimeout()
+
+class WinCheckCache:
+    """The last position find_winning_move found no win in, for one player's searches
+
+    Players check the position before searching it and the root node
+    checks it again; given the same cache, the second check reuses the
+    first one's simulated children. Kept by whoever owns the searches,
+    like the transposition table.
+    """
+
+    def __init__(self):
+        self.key = None
+        self.moves = None
+        self.children = None
+        self.win_checks = 0
+        self.waves = 0
+
+def find_winning_move(board, valid_moves, color, children=None, max_iterations=WIN_CHECK_MAX_ITERATIONS, cache=None,
+                      stats=None):
+    """First move in valid_moves that wins outright, or None
+
+    A move that doesn't explode takes no enemy orbs, so while the opponent
+    has orbs and no chain reaction is pending only moves onto cells one orb
+    from critical mass are simulated. children, a dict, gets the
+    capture_move result of each simulated move that settled, for the search
+    to replay instead of exploding it again. With a WinCheckCache the same
+    check repeated is answered from it. stats counts the simulated moves
+    and their waves, also when they come from the cache.
+    """
+    if stats is None:
+        stats = NULL_STATS
+    if cache is not None:
+        key = (board.hash, color, tuple(board.frontier), max_iterations)
+        if key == cache.key and set(valid_moves) == cache.moves:
+            stats.win_checks += cache.win_checks
+            stats.waves += cache.waves
+            if children is not None:
+                children.update(cache.children)
+            return None
+    if children is None:
+        children = {}
+    counts = board.counts
+    only_explosive = not board.frontier and board.orbs[COLOR_CODE[OPPONENT_COLOR[color]]] > 0
+    win_checks = total_waves = 0
+    for r, c in valid_moves:
+        i = r * COLS + c
+        if only_explosive and counts[i] + 1 < CRITICAL_MASS_AT[i]:
+            continue
+        win_checks += 1
+        waves = make_move(board, r, c, color, max_iterations)
+        total_waves += waves
+        winner = check_winner(board)
+        if waves < max_iterations:
+            children[(r, c)] = capture_move(board)
+        unmake_move(board)
+        if winner == color:
+            stats.win_checks += win_checks
+            stats.waves += total_waves
+            return (r, c)
+    stats.win_checks += win_checks
+    stats.waves += total_waves
+    if cache is not None:
+        cache.key, cache.moves, cache.children = key, set(valid_moves), children
+        cache.win_checks, cache.waves = win_checks, total_waves
+    return None
+
+class MoveHistory:
+    """Killer moves and history scores, learned from the cutoffs of one search
+
+    killers[depth] holds the last two moves that caused a cutoff at that
+    remaining depth, which within one search is a ply. scores[color][cell]
+    grows by depth * depth for every cutoff a move caused, so cutoffs near
+    the root weigh most. wins, a WinCheckCache, lets the win checks reuse
+    one made before the search.
+    """
+
+    def __init__(self, wins=None):
+        self.killers = {}
+        self.scores = {'R': [0] * CELLS, 'B': [0] * CELLS}
+        self.wins = wins
+
+    def cutoff(self, move, depth, color):
+        """Record a move that caused a cutoff at this depth"""
+        killers = self.killers.setdefault(depth, [])
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[2:]
+        self.scores[color][move[0] * COLS + move[1]] += depth * depth
+
+def order_moves(board, moves, tt_move=None, killers=(), history=None):
+    """Sort moves in place, most promising first, tt_move (if valid) leading
+
+    With history, a list of per-cell scores from MoveHistory, the killers
+    come right after tt_move and the rest are sorted by history score
+    before the static priority below.
+    """
+    counts = board.counts
+    
+    # Move ordering: prioritize moves that affect more cells
+    def move_priority(move):
+        r, c = move
+        i = r * COLS + c
+        count = counts[i]
+        priority = 0
+        
+        # Prefer moves on cells with more orbs
+        priority += count * 2
+        
+        # Prefer corner and edge positions
+        priority += POSITION_WEIGHT_AT[i]
+        
+        # Prefer moves close to critical mass
+        if count:  # valid moves are always empty or own cells
+            priority += (count / CRITICAL_MASS_AT[i]) * 5
+        
+        return -priority  # Negative for descending sort
+    
+    if history is None:
+        moves.sort(key=move_priority)
+    else:
+        moves.sort(key=lambda move: (-history[move[0] * COLS + move[1]], move_priority(move)))
+    
+    # Then the moves that caused cutoffs at this depth, and the stored best move first
+    for move in reversed(killers):
+        if move in moves:
+            moves.remove(move)
+            moves.insert(0, move)
+    if tt_move in moves:
+        moves.remove(tt_move)
+        moves.insert(0, tt_move)
+    return moves
+
+class NullStats:
+    """What the search uses as its stats when it isn't instrumented
+
+    Has the phase methods of engine.stats.SearchStats, as the plain engine
+    functions, and counters nobody reads, so a plain search runs the same
+    code as an instrumented one.
+    """
+
+    def __init__(self):
+        for name in COUNTERS:
+            setattr(self, name, 0)
+        self.get_valid_moves = get_valid_moves
+        self.order_moves = order_moves
+        self.make_move = make_move
+        self.replay_move = replay_move
+        self.evaluate = evaluate_board
+        self.find_winning_move = find_winning_move
+
+NULL_STATS = NullStats()
+
+def quiescence(board, depth, alpha, beta, maximizing_player, level, color='B', stats=None):
+    """Search explosive moves below a leaf until the position is quiet, returns the score
+
+    The side to move may stand pat on the evaluation, or make one of
+    get_explosive_moves' moves, whose chain reaction takes enemy cells and
+    which the evaluation can badly misjudge. depth bounds the plies
+    searched. Scores are from color's point of view, as in minimax_no_timeout.
+    """
+    if stats is None:
+        stats = NULL_STATS
+    stats.quiescence_nodes += 1
+    score = stats.evaluate(board, level, color)
+    if depth == 0:
+        return score
+    player_color = color if maximizing_player else OPPONENT_COLOR[color]
+    
+    # Standing pat is a bound already
+    if maximizing_player:
+        if score >= beta:
+            return score
+        alpha = max(alpha, score)
+    else:
+        if score <= alpha:
+            return score
+        beta = min(beta, score)
+    
+    best_eval = score
+    for r, c in get_explosive_moves(board, player_color):
+        stats.make_move(board, r, c, player_color, SEARCH_MAX_ITERATIONS)
+        try:
+            if check_winner(board) == player_color:
+                eval_score = WIN_SCORE if maximizing_player else -WIN_SCORE
+            else:
+                eval_score = quiescence(board, depth - 1, alpha, beta, not maximizing_player, level, color, stats)
+        finally:
+            unmake_move(board)
+        
+        if maximizing_player:
+            best_eval = max(best_eval, eval_score)
+            alpha = max(alpha, eval_score)
+        else:
+            best_eval = min(best_eval, eval_score)
+            beta = min(beta, eval_score)
+        if beta <= alpha:
+            break
+    
+    return best_eval
+
+def _probe(board, depth, alpha, beta, maximizing_player, level, color, tt, stats):
+    """Leaf scores and table lookups shared by the node searches, returns (key, tt_move, result)
+
+    Scores and the window are from color's point of view. result is the
+    node's (score, move) when a leaf score or a table entry settles it,
+    else None; key is the node's table key and tt_move the stored best move.
+    """
+    if depth == 0 and LEVEL_CONFIG[level].get("quiescence"):
+        # Depends on the window, so never stored in the table
+        score = quiescence(board, LEVEL_CONFIG[level]["quiescence"], alpha, beta, maximizing_player, level, color,
+                           stats)
+        return None, None, (score, None)
+    if tt is None:
+        if depth == 0:
+            return None, None, (stats.evaluate(board, level, color), None)
+        return None, None, None
+    
+    # Probe the transposition table before expanding the node
+    key = position_key(board, maximizing_player)
+    entry = tt.probe(key)
+    if depth == 0:
+        if entry is not None and entry[2] == EXACT:
+            stats.tt_hits += 1
+            return key, None, (entry[3], entry[4])
+        score = stats.evaluate(board, level, color)
+        tt.store(key, 0, EXACT, score, None)
+        return key, None, (score, None)
+    
+    if entry is None:
+        return key, None, None
+    _, entry_depth, bound, entry_score, tt_move, _ = entry
+    if entry_depth >= depth:
+        if (bound == EXACT or (bound == LOWER and entry_score >= beta)
+                or (bound == UPPER and entry_score <= alpha)):
+            stats.tt_hits += 1
+            return key, tt_move, (entry_score, tt_move)
+    return key, tt_move, None
+
+def _expand(board, depth, maximizing_player, color, key, tt, tt_move, stats, history):
+    """The side to move's moves in search order, returns (moves, children, result)
+
+    children holds the moves the win check simulated, for _play to replay.
+    result, from color's point of view, settles the node instead when the
+    side to move has no move or color can win at once.
+    """
+    player_color = color if maximizing_player else OPPONENT_COLOR[color]
+    valid_moves = stats.get_valid_moves(board, player_color)
+    
+    if not valid_moves:
+        return None, None, ((-WIN_SCORE - depth) if maximizing_player else (WIN_SCORE + depth), None)
+    
+    # Quick win check for maximizing player (AI), keeping the simulated children
+    children = None
+    if maximizing_player:
+        children = {}
+        winning_move = stats.find_winning_move(board, valid_moves, player_color, children, WIN_CHECK_MAX_ITERATIONS,
+                                               history.wins if history is not None else None)
+        if winning_move is not None:
+            if tt is not None:
+                tt.store(key, depth, EXACT, WIN_SCORE + depth, winning_move)
+            return None, None, (WIN_SCORE + depth, winning_move)
+    
+    if history is None:
+        killers, scores = (), None
+    else:
+        killers, scores = history.killers.get(depth, ()), history.scores[player_color]
+    stats.order_moves(board, valid_moves, tt_move, killers, scores)
+    return valid_moves, children, None
+
+def _play(board, r, c, color, children, stats):
+    """Make a move in the search, replaying it if the win check left its result in children"""
+    child = children.get((r, c)) if children else None
+    if child is not None:
+        stats.replay_move(board, child)
+    else:
+        stats.make_move(board, r, c, color, SEARCH_MAX_ITERATIONS)
+
+def _cutoff(r, c, depth, color, stats, history):
+    """Record a move of color that caused a cutoff"""
+    stats.cutoffs += 1
+    if history is not None:
+        history.cutoff((r, c), depth, color)
+
+def _store(tt, key, depth, score, alpha, beta, move):
+    """Store a searched node, score from color's point of view and bounded by the window it was searched in"""
+    if tt is None:
+        return
+    if score <= alpha:
+        bound = UPPER
+    elif score >= beta:
+        bound = LOWER
+    else:
+        bound = EXACT
+    tt.store(key, depth, bound, score, move)
+
+def minimax_no_timeout(board, depth, alpha, beta, maximizing_player, level, color='B', tt=None, deadline=None,
+                       stats=None, history=None):
+    """Minimax algorithm without timeout - pure iteration-based
+
+    Scores are from color's point of view: color moves at maximizing nodes
+    and its opponent at minimizing ones. stats, an engine.stats.SearchStats,
+    gets the node counters and per-phase timers. history, a MoveHistory,
+    orders the moves by the cutoffs found so far. A level with a
+    "quiescence" ply limit scores the leaves by quiescence().
+    """
+    if stats is None:
+        stats = NULL_STATS
+    stats.nodes += 1
+    key, tt_move, result = _probe(board, depth, alpha, beta, maximizing_player, level, color, tt, stats)
+    if result is not None:
+        return result
+    
+    # Iterative deepening aborts the iteration here once time is up
+    check_deadline(deadline)
+    
+    alpha_orig, beta_orig = alpha, beta
+    valid_moves, children, result = _expand(board, depth, maximizing_player, color, key, tt, tt_move, stats, history)
+    if result is not None:
+        return result
+    player_color = color if maximizing_player else OPPONENT_COLOR[color]
+    
+    best_move = None
+    best_eval = float('-inf') if maximizing_player else float('inf')
+    
+    for r, c in valid_moves:
+        _play(board, r, c, player_color, children, stats)
+        try:
+            eval_score, _ = minimax_no_timeout(board, depth - 1, alpha, beta, not maximizing_player, level,
+                                               color, tt, deadline, stats, history)
+        finally:
+            unmake_move(board)
+        
+        if maximizing_player:
+            if eval_score > best_eval:
+                best_eval = eval_score
+                best_move = (r, c)
+            alpha = max(alpha, eval_score)
+        else:
+            if eval_score < best_eval:
+                best_eval = eval_score
+                best_move = (r, c)
+            beta = min(beta, eval_score)
+            
+        if beta <= alpha:
+            _cutoff(r, c, depth, player_color, stats, history)
+            break
+    
+    _store(tt, key, depth, best_eval, alpha_orig, beta_orig, best_move)
+    return best_eval, best_move
+
+def _negascout(board, depth, alpha, beta, maximizing_player, level, color, tt, deadline, stats, history):
+    """Negamax body of principal_variation_search, scores from the side to move's point of view
+
+    The helpers it shares with minimax_no_timeout work from color's point
+    of view, so the window goes in and the scores come out negated at the
+    opponent's nodes.
+    """
+    stats.nodes += 1
+    sign = 1 if maximizing_player else -1
+    low, high = (alpha, beta) if maximizing_player else (-beta, -alpha)
+    key, tt_move, result = _probe(board, depth, low, high, maximizing_player, level, color, tt, stats)
+    if result is not None:
+        return sign * result[0], result[1]
+    
+    check_deadline(deadline)
+    
+    valid_moves, children, result = _expand(board, depth, maximizing_player, color, key, tt, tt_move, stats, history)
+    if result is not None:
+        return sign * result[0], result[1]
+    side = color if maximizing_player else OPPONENT_COLOR[color]
+    
+    best_move = None
+    best_eval = float('-inf')
+    
+    for index, (r, c) in enumerate(valid_moves):
+        _play(board, r, c, side, children, stats)
+        try:
+            if index == 0:
+                eval_score = -_negascout(board, depth - 1, -beta, -alpha, not maximizing_player, level, color,
+                                         tt, deadline, stats, history)[0]
+            else:
+                # Only prove the move is no better than alpha; search it properly if it is
+                eval_score = -_negascout(board, depth - 1, -alpha - NULL_WINDOW, -alpha, not maximizing_player,
+                                         level, color, tt, deadline, stats, history)[0]
+                if alpha < eval_score < beta:
+                    stats.researches += 1
+                    eval_score = -_negascout(board, depth - 1, -beta, -alpha, not maximizing_player, level,
+                                             color, tt, deadline, stats, history)[0]
+        finally:
+            unmake_move(board)
+        
+        if eval_score > best_eval:
+            best_eval = eval_score
+            best_move = (r, c)
+        alpha = max(alpha, eval_score)
+        
+        if beta <= alpha:
+            _cutoff(r, c, depth, side, stats, history)
+            break
+    
+    _store(tt, key, depth, sign * best_eval, low, high, best_move)
+    return best_eval, best_move
+
+def principal_variation_search(board, depth, alpha, beta, maximizing_player, level, color='B', tt=None,
+                               deadline=None, stats=None, history=None):
+    """Principal variation search (negascout), a drop-in for minimax_no_timeout
+
+    The first move at each node, the best by the move ordering, gets the
+    full window; the others a null window just above alpha, which only
+    shows they are no better. A move that turns out better is searched
+    again with the full window. Arguments, scores and table entries are
+    as in minimax_no_timeout, so the two can share a table.
+    """
+    if stats is None:
+        stats = NULL_STATS
+    if maximizing_player:
+        return _negascout(board, depth, alpha, beta, True, level, color, tt, deadline, stats, history)
+    score, move = _negascout(board, depth, -beta, -alpha, False, level, color, tt, deadline, stats, history)
+    return -score, move
+
+# Node searches a level can pick with the "search" key of LEVEL_CONFIG
+NODE_SEARCHES = {"alphabeta": minimax_no_timeout, "pvs": principal_variation_search}
+
+def node_search(level):
+    """The level's node search, minimax_no_timeout unless LEVEL_CONFIG names another"""
+    return NODE_SEARCHES[LEVEL_CONFIG[level].get("search", "alphabeta")]
+
+def aspiration_search(search, board, depth, level, color, tt, deadline, stats, guess, wins=None):
+    """Root search in a window around guess, widened until the score falls inside, returns (score, move)
+
+    search is a node search, minimax_no_timeout or principal_variation_search.
+    A score at or outside the window is only a bound, so that side of the
+    window is widened and the root searched again; the move ordering learned
+    so far is kept. stats counts the fail-lows and fail-highs, and wins is
+    the MoveHistory's WinCheckCache.
+    """
+    if stats is None:
+        stats = NULL_STATS
+    history = MoveHistory(wins)
+    low = high = ASPIRATION_WINDOW
+    while True:
+        alpha = guess - low if low < WIN_SCORE else float('-inf')
+        beta = guess + high if high < WIN_SCORE else float('inf')
+        score, move = search(board, depth, alpha, beta, True, level, color, tt, deadline, stats, history)
+        if score <= alpha:
+            stats.aspiration_fail_lows += 1
+            low *= ASPIRATION_GROWTH
+        elif score >= beta:
+            stats.aspiration_fail_highs += 1
+            high *= ASPIRATION_GROWTH
+        else:
+            return score, move
+
+def search_root(board, depth, level, color='B', tt=None, deadline=None, stats=None, guess=None, wins=None):
+    """Search of the root position, returns (score, move)
+
+    Full width, or an aspiration window around guess, the score expected.
+    wins is a WinCheckCache for the root's win check.
+    """
+    if guess is not None:
+        return aspiration_search(node_search(level), board, depth, level, color, tt, deadline, stats, guess, wins)
+    return node_search(level)(board, depth, float('-inf'), float('inf'), True, level, color, tt, deadline, stats,
+                              MoveHistory(wins))
+
+def iterative_deepening(board, level, move_time, color='B', tt=None, max_depth=MAX_DEPTH, search=search_root,
+                        stats=None, wins=None):
+    """Search depth 1, 2, 3, ... until move_time seconds are used up
+
+    Returns (score, move, depth) from the last iteration that completed.
+    Depth 1 always runs to completion so there is a move even with a tiny
+    budget; after that a new iteration is only started while less than half
+    the budget is spent, as it would almost never finish in the rest.
+    From depth 3 on each iteration searches an aspiration window around
+    the score of two iterations before: scores swing between odd and even
+    depths, so that is a much closer guess than the last one.
+    """
+    start_time = time.time()
+    deadline = start_time + move_time
+    if tt is not None:
+        tt.new_search()
+
+    score, move = search(board, 1, level, color, tt, None, stats, None, wins)
+    depth_reached = 1
+    scores = [score]
+
+    for depth in range(2, max_depth + 1):
+        if move is None or abs(score) >= WIN_SCORE:
+            break
+        if time.time() - start_time > move_time / 2:
+            break
+        guess = scores[-2] if len(scores) >= 2 else None
+        try:
+            result = search(board, depth, level, color, tt, deadline, stats, guess, wins)
+        except SearchTimeout:
+            break
+        score, move = result
+        scores.append(score)
+        depth_reached = depth
+
+    return score, move, depth_reached
+
+def search_best_move(board, level, color='B', tt=None, move_time=None, search=search_root, stats=None, wins=None):
+    """Search the position for color at the given level
+
+    With a move_time budget the search deepens iteratively, otherwise it
+    runs to the level's fixed depth. search is the root search to use,
+    search_root or ParallelSearch.search_root, and stats an optional
+    engine.stats.SearchStats to fill in, wins the WinCheckCache the root
+    shares with the player's own win check. Returns (score, move, depth).
+    """
+    if move_time:
+        return iterative_deepening(board, level, move_time, color, tt, search=search, stats=stats, wins=wins)
+    
+    depth = LEVEL_CONFIG[level]["depth"]
+    if tt is not None:
+        tt.new_search()
+        # Move orders only transpose from depth 3 on, below that the table is overhead;
+        # quiescence plies don't count, as they are never stored
+        if depth < 3:
+            tt = None
+    score, move = search(board, depth, level, color, tt, None, stats, None, wins)
+    return score, move, depth
+
+def get_smart_random_move(valid_moves, rng=random):
+    """Get a smart random move (prefer corners/edges), chosen with rng"""
+    corner_moves = []
+    edge_moves = []
+    center_moves = []
+    
+    for r, c in valid_moves:
+        if (r in [0, ROWS-1]) and (c in [0, COLS-1]):
+            corner_moves.append((r, c))
+        elif r in [0, ROWS-1] or c in [0, COLS-1]:
+            edge_moves.append((r, c))
+        else:
+            center_moves.append((r, c))
+    
+    # Choose from corner first, then edge, then center
+    if corner_moves:
+        return rng.choice(corner_moves)
+    elif edge_moves:
+        return rng.choice(edge_moves)
+    else:
+        return rng.choice(center_moves)
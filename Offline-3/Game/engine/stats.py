@@ -0,0 +1,95 @@
+# engine/stats.py - optional instrumentation for the minimax search
+import json
+import time
+
+from engine.board import get_valid_moves, make_move, replay_move
+from engine.evaluate import evaluate_board
+
+# Counters and timed phases kept by SearchStats
+COUNTERS = ("nodes", "quiescence_nodes", "cutoffs", "researches", "aspiration_fail_lows", "aspiration_fail_highs",
+            "tt_hits", "win_checks", "replays", "waves", "evaluations", "playouts")
+PHASES = ("move_generation", "move_ordering", "explosion", "evaluation", "win_check")
+
+class SearchStats:
+    """Counters and per-phase timers for one search
+
+    Passed to minimax_no_timeout as stats, which makes its calls through
+    the methods below. The timers use time.perf_counter and are in
+    seconds. Without stats the search makes the same calls on
+    engine.search.NULL_STATS, whose methods are the plain engine functions.
+    """
+
+    def __init__(self):
+        for name in COUNTERS:
+            setattr(self, name, 0)
+        self.times = dict.fromkeys(PHASES, 0.0)
+
+    def get_valid_moves(self, board, color):
+        start = time.perf_counter()
+        moves = get_valid_moves(board, color)
+        self.times["move_generation"] += time.perf_counter() - start
+        return moves
+
+    def order_moves(self, board, moves, tt_move, killers=(), history=None):
+        from engine.search import order_moves
+        start = time.perf_counter()
+        order_moves(board, moves, tt_move, killers, history)
+        self.times["move_ordering"] += time.perf_counter() - start
+
+    def make_move(self, board, r, c, color, max_iterations):
+        start = time.perf_counter()
+        self.waves += make_move(board, r, c, color, max_iterations)
+        self.times["explosion"] += time.perf_counter() - start
+
+    def evaluate(self, board, level, color):
+        start = time.perf_counter()
+        score = evaluate_board(board, level, color)
+        self.times["evaluation"] += time.perf_counter() - start
+        self.evaluations += 1
+        return score
+
+    def replay_move(self, board, move):
+        start = time.perf_counter()
+        replay_move(board, move)
+        self.times["explosion"] += time.perf_counter() - start
+        self.replays += 1
+
+    def find_winning_move(self, board, moves, color, children, max_iterations, cache=None):
+        from engine.search import find_winning_move
+        start = time.perf_counter()
+        winning_move = find_winning_move(board, moves, color, children, max_iterations, cache, self)
+        self.times["win_check"] += time.perf_counter() - start
+        return winning_move
+
+    def merge(self, other):
+        """Add the counts and times of another SearchStats or its as_dict()"""
+        if isinstance(other, SearchStats):
+            other = other.as_dict()
+        for name in COUNTERS:
+            setattr(self, name, getattr(self, name) + other[name])
+        for phase in PHASES:
+            self.times[phase] += other["times"][phase]
+
+    def as_dict(self):
+        """Counts and times as a JSON-ready dict"""
+        result = {name: getattr(self, name) for name in COUNTERS}
+        result["times"] = dict(self.times)
+        return result
+
+def write_search_log(filename, player, level, depth, move, score, think_time, stats):
+    """Append one move's search statistics to a JSON-lines log"""
+    record = {
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "player": player,
+        "level": level,
+        "depth": depth,
+        "move": move,
+        "score": score,
+        "think_time": think_time,
+    }
+    record.update(stats.as_dict())
+    try:
+        with open(filename, 'a') as f:
+            f.write(json.dumps(record) + '\n')
+    except Exception as e:
+        print(f"Error writing search log: {e}")
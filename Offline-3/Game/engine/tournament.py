@@ -0,0 +1,183 @@
+# engine/tournament.py - round-robin and gauntlet tournaments with ratings
+import os
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from engine.board import Board, OPPONENT_COLOR, get_valid_moves, apply_move, explode, check_winner
+from engine.levels import LEVEL_CONFIG
+from engine.match import make_agent, play_match
+
+# Every agent: the random player and each level
+ALL_AGENTS = ["random"] + [f"level{level}" for level in LEVEL_CONFIG]
+
+# Elo points per factor of 10 in Bradley-Terry strength
+ELO_SCALE = 400
+
+def random_opening(rng, plies):
+    """A random move sequence of the given length that doesn't end the game"""
+    while True:
+        board = Board()
+        color = 'R'
+        opening = []
+        for ply in range(plies):
+            move = rng.choice(get_valid_moves(board, color))
+            apply_move(board, move[0], move[1], color)
+            explode(board, max_iterations=1000)
+            opening.append(move)
+            if ply >= 2 and check_winner(board):
+                break
+            color = OPPONENT_COLOR[color]
+        else:
+            return opening
+
+def make_schedule(agents, mode="round_robin", openings=2, opening_plies=4, seed=0):
+    """List of games as (red, blue, opening) tuples
+
+    round_robin pairs every agent with every other, gauntlet the first
+    agent with each of the rest. Each pair plays every opening twice, once
+    with each color, so neither first-move advantage nor a lucky opening
+    favors one side.
+    """
+    if mode == "round_robin":
+        pairs = [(a, b) for i, a in enumerate(agents) for b in agents[i + 1:]]
+    elif mode == "gauntlet":
+        pairs = [(agents[0], b) for b in agents[1:]]
+    else:
+        raise ValueError(f"Unknown tournament mode {mode!r}")
+
+    rng = random.Random(seed)
+    schedule = []
+    for a, b in pairs:
+        for _ in range(openings):
+            opening = random_opening(rng, opening_plies)
+            schedule.append((a, b, opening))
+            schedule.append((b, a, opening))
+    return schedule
+
+def play_game(game, move_time=None, seed=None):
+    """Play one scheduled game, returns its result without the move list"""
+    red_spec, blue_spec, opening = game
+    red = make_agent(red_spec, seed, move_time)
+    blue = make_agent(blue_spec, None if seed is None else seed + 1, move_time)
+    result = play_match(red, blue, opening)
+
+    # Think time per side, agent moves only
+    for color, name in (('R', "red"), ('B', "blue")):
+        times = [m["time"] for m in result["moves"][len(opening):] if m["color"] == color]
+        result[f"{name}_time"] = sum(times)
+        result[f"{name}_moves"] = len(times)
+    del result["moves"]
+    result["opening"] = opening
+    return result
+
+def _play_indexed(args):
+    index, game, move_time, seed = args
+    return play_game(game, move_time, seed + index)
+
+def run_tournament(schedule, workers=None, move_time=None, seed=0):
+    """Play all games of a schedule over a process pool, returns the results in order"""
+    workers = workers or os.cpu_count() or 1
+    tasks = [(index, game, move_time, seed) for index, game in enumerate(schedule)]
+    if workers == 1:
+        return [_play_indexed(task) for task in tasks]
+    with ProcessPoolExecutor(workers) as pool:
+        return list(pool.map(_play_indexed, tasks))
+
+def _game_scores(results):
+    """(a, b, score of a) per game, draws count half"""
+    scores = []
+    for result in results:
+        score = {'R': 1.0, 'B': 0.0}.get(result["winner"], 0.5)
+        scores.append((result["red"], result["blue"], score))
+    return scores
+
+def bradley_terry(scores, agents, prior=1.0, iterations=200):
+    """Bradley-Terry ratings on the Elo scale from (a, b, score of a) games
+
+    Fitted with the MM algorithm. prior adds that many virtual drawn games
+    to every pair that met, which keeps the ratings finite when one agent
+    won every game. Ratings are shifted so their mean is 0.
+    """
+    index = {agent: i for i, agent in enumerate(agents)}
+    n = len(agents)
+    wins = [0.0] * n
+    games = [[0.0] * n for _ in range(n)]
+    for a, b, score in scores:
+        i, j = index[a], index[b]
+        wins[i] += score
+        wins[j] += 1 - score
+        games[i][j] += 1
+        games[j][i] += 1
+    for i in range(n):
+        for j in range(n):
+            if games[i][j]:
+                games[i][j] += prior
+                wins[i] += prior / 2
+
+    strength = [1.0] * n
+    for _ in range(iterations):
+        new = []
+        for i in range(n):
+            denominator = sum(games[i][j] / (strength[i] + strength[j]) for j in range(n) if games[i][j])
+            new.append(wins[i] / denominator if denominator else strength[i])
+        # Normalize by the geometric mean to keep the scale fixed
+        log_mean = sum(math.log(s) for s in new) / n
+        strength = [s / math.exp(log_mean) for s in new]
+
+    return {agent: ELO_SCALE * math.log10(strength[index[agent]]) for agent in agents}
+
+def rating_table(results, agents=None, bootstrap=200, seed=0):
+    """One row per agent, strongest first
+
+    Each row holds the Bradley-Terry rating with a 95% confidence interval
+    from resampling the games, the games played, the score fraction, and
+    the mean think time per move in milliseconds.
+    """
+    scores = _game_scores(results)
+    if agents is None:
+        agents = sorted({a for a, _, _ in scores} | {b for _, b, _ in scores})
+    ratings = bradley_terry(scores, agents)
+
+    rng = random.Random(seed)
+    samples = {agent: [] for agent in agents}
+    for _ in range(bootstrap):
+        resampled = [rng.choice(scores) for _ in scores]
+        for agent, rating in bradley_terry(resampled, agents).items():
+            samples[agent].append(rating)
+
+    rows = []
+    for agent in agents:
+        played = points = think_time = moves = 0
+        for result, (a, b, score) in zip(results, scores):
+            if agent == a:
+                played += 1
+                points += score
+                think_time += result["red_time"]
+                moves += result["red_moves"]
+            elif agent == b:
+                played += 1
+                points += 1 - score
+                think_time += result["blue_time"]
+                moves += result["blue_moves"]
+        ordered = sorted(samples[agent])
+        rows.append({
+            "agent": agent,
+            "rating": ratings[agent],
+            "ci_low": ordered[int(0.025 * len(ordered))] if ordered else ratings[agent],
+            "ci_high": ordered[int(0.975 * len(ordered)) - 1] if ordered else ratings[agent],
+            "games": played,
+            "score": points / played if played else 0.0,
+            "ms_per_move": 1000 * think_time / moves if moves else 0.0,
+        })
+    rows.sort(key=lambda row: row["rating"], reverse=True)
+    return rows
+
+def format_table(rows):
+    """Rating table as text"""
+    lines = [f"{'#':>2}  {'agent':<12} {'rating':>7}  {'95% CI':>15}  {'games':>5}  {'score':>6}  {'ms/move':>8}"]
+    for rank, row in enumerate(rows, 1):
+        ci = f"[{row['ci_low']:.0f}, {row['ci_high']:.0f}]"
+        lines.append(f"{rank:>2}  {row['agent']:<12} {row['rating']:>7.0f}  {ci:>15}  {row['games']:>5}  "
+                     f"{row['score']:>6.1%}  {row['ms_per_move']:>8.2f}")
+    return '\n'.join(lines)
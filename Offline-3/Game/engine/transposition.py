@@ -0,0 +1,126 @@
+# engine/transposition.py - transposition table for the minimax search
+import struct
+from multiprocessing import shared_memory
+
+from engine.board import COLS, CELL_COORDS, SIDE_KEY
+
+# Bound types stored with each score
+EXACT, LOWER, UPPER = 0, 1, 2
+
+def position_key(board, maximizing_player):
+    """Zobrist key of a search node: board hash plus the side to move"""
+    return board.hash ^ SIDE_KEY if maximizing_player else board.hash
+
+class TranspositionTable:
+    """Fixed-size table of search results indexed by Zobrist key
+
+    Entries are (key, depth, bound, score, move, generation) tuples, one per
+    slot. A store replaces the slot if it holds the same position, an entry
+    from an earlier search, or a shallower one (depth-preferred with aging).
+    """
+
+    def __init__(self, size_bits=18):
+        self.mask = (1 << size_bits) - 1
+        self.slots = [None] * (1 << size_bits)
+        self.generation = 0
+
+    def new_search(self):
+        """Start a new move: older entries become replaceable"""
+        self.generation += 1
+
+    def clear(self):
+        """Drop all entries"""
+        self.slots = [None] * len(self.slots)
+
+    def probe(self, key):
+        """Return the entry stored for key, or None"""
+        entry = self.slots[key & self.mask]
+        if entry is not None and entry[0] == key:
+            return entry
+        return None
+
+    def store(self, key, depth, bound, score, move):
+        """Store a search result, subject to the replacement policy"""
+        index = key & self.mask
+        old = self.slots[index]
+        if (old is None or old[0] == key or old[5] != self.generation
+                or depth >= old[1]):
+            self.slots[index] = (key, depth, bound, score, move, self.generation)
+
+# Shared table slots are three 64-bit words: key ^ data ^ score bits, data, score bits.
+# data packs depth (8 bits), bound (2), generation (16), move cell (7, NO_MOVE for None)
+# and a used bit, so a stored entry is never all zero
+_DOUBLE = struct.Struct('d')
+_WORD = struct.Struct('Q')
+NO_MOVE = 127
+
+class SharedTranspositionTable:
+    """TranspositionTable kept in a multiprocessing.shared_memory buffer
+
+    Any number of processes can attach to the same table by name. Entries
+    are written without locking: the first word of a slot is the key XORed
+    with the other two, so a probe that reads a half-written slot sees a
+    key mismatch and treats it as empty. Word 0 of the buffer holds the
+    current generation, shared by all processes.
+    """
+
+    def __init__(self, size_bits=18, name=None):
+        self.mask = (1 << size_bits) - 1
+        size = (1 + 3 * (1 << size_bits)) * 8
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+            self.owner = True
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            self.owner = False
+        self.name = self.shm.name
+        self.words = self.shm.buf.cast('Q')
+
+    @property
+    def generation(self):
+        return self.words[0]
+
+    def new_search(self):
+        """Start a new move: older entries become replaceable"""
+        self.words[0] = (self.words[0] + 1) & 0xFFFF
+
+    def clear(self):
+        """Drop all entries"""
+        words = self.words
+        for i in range(1, len(words)):
+            words[i] = 0
+
+    def probe(self, key):
+        """Return the entry stored for key, or None"""
+        words = self.words
+        slot = 1 + 3 * (key & self.mask)
+        data = words[slot + 1]
+        score_bits = words[slot + 2]
+        if words[slot] ^ data ^ score_bits != key or not data:
+            return None
+        move = data >> 26 & NO_MOVE
+        return (key, data & 0xFF, data >> 8 & 3, _DOUBLE.unpack(_WORD.pack(score_bits))[0],
+                None if move == NO_MOVE else CELL_COORDS[move], data >> 10 & 0xFFFF)
+
+    def store(self, key, depth, bound, score, move):
+        """Store a search result, subject to the replacement policy"""
+        words = self.words
+        generation = words[0]
+        slot = 1 + 3 * (key & self.mask)
+        old_data = words[slot + 1]
+        if (old_data and words[slot] ^ old_data ^ words[slot + 2] != key
+                and old_data >> 10 & 0xFFFF == generation and depth < old_data & 0xFF):
+            return
+        cell = NO_MOVE if move is None else move[0] * COLS + move[1]
+        data = min(depth, 0xFF) | bound << 8 | generation << 10 | cell << 26 | 1 << 33
+        score_bits = _WORD.unpack(_DOUBLE.pack(score))[0]
+        words[slot] = key ^ data ^ score_bits
+        words[slot + 1] = data
+        words[slot + 2] = score_bits
+
+    def close(self):
+        """Detach from the buffer, and free it if this process created it"""
+        self.words.release()
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
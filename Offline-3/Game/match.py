@@ -0,0 +1,51 @@
+# match.py - play AI agents against each other headless, without main_menu
+import sys
+import json
+import argparse
+
+from engine.match import make_agent, play_match
+
+def main():
+    """Play a series of games and print the results"""
+    parser = argparse.ArgumentParser(description="Headless Chain Reaction matches between AI agents")
+    parser.add_argument("red", help="Red agent: random, smart:N, heuristic:N or levelN")
+    parser.add_argument("blue", help="Blue agent, same forms as red")
+    parser.add_argument("--games", type=int, default=1, help="number of games to play")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the random and Monte Carlo agents")
+    parser.add_argument("--move-time", type=float, default=None, help="seconds per move (iterative deepening)")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes per search")
+    parser.add_argument("--parallel", default="root", help="parallel search mode: root or lazy_smp")
+    parser.add_argument("--search-log", default=None, help="append per-move search statistics to this JSON-lines file")
+    parser.add_argument("--json", action="store_true", help="print every game, with its moves, as JSON")
+    args = parser.parse_args()
+    
+    options = dict(move_time=args.move_time, workers=args.workers, parallel=args.parallel,
+                   search_log=args.search_log)
+    try:
+        red = make_agent(args.red, args.seed, **options)
+        blue = make_agent(args.blue, None if args.seed is None else args.seed + 1, **options)
+    except ValueError as e:
+        parser.error(str(e))
+    
+    results = []
+    for game in range(args.games):
+        result = play_match(red, blue)
+        results.append(result)
+        
+        if not args.json:
+            winner = {'R': f"{result['red']} (R)", 'B': f"{result['blue']} (B)"}.get(result["winner"])
+            outcome = f"{winner} wins by {result['reason']}" if winner else "draw"
+            times = [m["time"] for m in result["moves"]]
+            print(f"Game {game + 1}: {outcome} in {result['plies']} plies, "
+                  f"{result['duration']:.2f}s (max move {max(times):.3f}s)")
+    
+    if args.json:
+        json.dump(results, sys.stdout, indent=1)
+        print()
+    else:
+        red_wins = sum(r["winner"] == 'R' for r in results)
+        blue_wins = sum(r["winner"] == 'B' for r in results)
+        print(f"{args.red} (R) {red_wins} - {blue_wins} {args.blue} (B), {len(results) - red_wins - blue_wins} draws")
+
+if __name__ == "__main__":
+    main()
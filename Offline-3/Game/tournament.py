@@ -0,0 +1,36 @@
+# tournament.py - rate the AI agents against each other over a process pool
+import json
+import argparse
+
+from engine.tournament import ALL_AGENTS, make_schedule, run_tournament, rating_table, format_table
+
+def main():
+    """Run a tournament and print (and optionally save) the rating table"""
+    parser = argparse.ArgumentParser(description="Chain Reaction AI tournament with Bradley-Terry ratings")
+    parser.add_argument("agents", nargs="*", default=ALL_AGENTS,
+                        help="agents (random, smart:N, heuristic:N, levelN), default: random and every level")
+    parser.add_argument("--mode", choices=["round_robin", "gauntlet"], default="round_robin",
+                        help="gauntlet plays the first agent against each of the others")
+    parser.add_argument("--openings", type=int, default=2, help="openings per pair, each played with both colors")
+    parser.add_argument("--opening-plies", type=int, default=4, help="random moves in each opening")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--move-time", type=float, default=None, help="seconds per move (iterative deepening)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for openings, random and Monte Carlo agents")
+    parser.add_argument("--output", help="write the games and the rating table to this JSON file")
+    args = parser.parse_args()
+    
+    if len(args.agents) < 2:
+        parser.error("need at least two agents")
+    schedule = make_schedule(args.agents, args.mode, args.openings, args.opening_plies, args.seed)
+    print(f"Playing {len(schedule)} games between {len(args.agents)} agents ({args.mode})...")
+    results = run_tournament(schedule, args.workers, args.move_time, args.seed)
+    rows = rating_table(results, args.agents, seed=args.seed)
+    print(format_table(rows))
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({"ratings": rows, "games": results}, f, indent=1)
+        print(f"Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()